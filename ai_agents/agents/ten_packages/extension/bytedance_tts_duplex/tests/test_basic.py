@@ -94,10 +94,9 @@ class ExtensionTesterDump(ExtensionTester):
         """Find the dump file created by the TTS extension in the fixed dump directory."""
         if not os.path.exists(self.dump_dir):
             return None
+        own_name = os.path.basename(self.test_dump_file_path)
         for filename in os.listdir(self.dump_dir):
-            if filename.endswith(".pcm") and filename != os.path.basename(
-                self.test_dump_file_path
-            ):
+            if filename.endswith(".pcm") and filename != own_name:
                 return os.path.join(self.dump_dir, filename)
         return None
 
@@ -119,13 +118,20 @@ def test_dump_functionality(MockBytedanceV3Client):
 
     # --- Mock Configuration ---
     mock_instance = MockBytedanceV3Client.return_value
-    mock_instance.connect = AsyncMock()
-    mock_instance.start_connection = AsyncMock()
-    mock_instance.start_session = AsyncMock()
-    mock_instance.send_text = AsyncMock()
-    mock_instance.finish_session = AsyncMock()
-    mock_instance.finish_connection = AsyncMock()
-    mock_instance.close = AsyncMock()
+    mock_instance.configure_mock(
+        **{
+            name: AsyncMock()
+            for name in (
+                "connect",
+                "start_connection",
+                "start_session",
+                "send_text",
+                "finish_session",
+                "finish_connection",
+                "close",
+            )
+        }
+    )
 
     # Create some fake audio data to be streamed
     fake_audio_chunk_1 = b"\x11\x22\x33\x44" * 20
@@ -319,13 +325,20 @@ def test_flush_logic(MockBytedanceV3Client):
 
     # --- Mock Configuration ---
     mock_instance = MockBytedanceV3Client.return_value
-    mock_instance.connect = AsyncMock()
-    mock_instance.start_connection = AsyncMock()
-    mock_instance.start_session = AsyncMock()
-    mock_instance.send_text = AsyncMock()
-    mock_instance.finish_session = AsyncMock()
-    mock_instance.finish_connection = AsyncMock()
-    mock_instance.close = AsyncMock()
+    mock_instance.configure_mock(
+        **{
+            name: AsyncMock()
+            for name in (
+                "connect",
+                "start_connection",
+                "start_session",
+                "send_text",
+                "finish_session",
+                "finish_connection",
+                "close",
+            )
+        }
+    )
 
     # Create a cancel event to signal the mock audio stream to stop
     cancel_event = asyncio.Event()
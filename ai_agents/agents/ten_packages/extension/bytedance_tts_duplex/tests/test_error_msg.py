@@ -153,13 +153,20 @@ def test_invalid_params_fatal_error(MockBytedanceV3Client):
 
     # --- Mock Configuration ---
     mock_instance = MockBytedanceV3Client.return_value
-    mock_instance.connect = AsyncMock()
-    mock_instance.start_connection = AsyncMock()
-    mock_instance.start_session = AsyncMock()
-    mock_instance.send_text = AsyncMock()
-    mock_instance.finish_session = AsyncMock()
-    mock_instance.finish_connection = AsyncMock()
-    mock_instance.close = AsyncMock()
+    mock_instance.configure_mock(
+        **{
+            name: AsyncMock()
+            for name in (
+                "connect",
+                "start_connection",
+                "start_session",
+                "send_text",
+                "finish_session",
+                "finish_connection",
+                "close",
+            )
+        }
+    )
 
     # Mock send_text to raise an exception
     async def mock_send_text_with_error(text: str):
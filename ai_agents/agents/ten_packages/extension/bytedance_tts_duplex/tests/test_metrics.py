@@ -98,13 +98,20 @@ def test_ttfb_metric_is_sent(MockBytedanceV3Client):
 
     # --- Mock Configuration ---
     mock_instance = MockBytedanceV3Client.return_value
-    mock_instance.connect = AsyncMock()
-    mock_instance.start_connection = AsyncMock()
-    mock_instance.start_session = AsyncMock()
-    mock_instance.send_text = AsyncMock()
-    mock_instance.finish_session = AsyncMock()
-    mock_instance.finish_connection = AsyncMock()
-    mock_instance.close = AsyncMock()
+    mock_instance.configure_mock(
+        **{
+            name: AsyncMock()
+            for name in (
+                "connect",
+                "start_connection",
+                "start_session",
+                "send_text",
+                "finish_session",
+                "finish_connection",
+                "close",
+            )
+        }
+    )
 
     # Mock the client constructor to handle the response queue
     def mock_client_init(
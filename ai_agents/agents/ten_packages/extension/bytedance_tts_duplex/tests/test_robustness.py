@@ -132,12 +132,19 @@ def test_reconnect_after_connection_drop(MockBytedanceV3Client):
 
     # --- Mock Configuration ---
     mock_instance = MockBytedanceV3Client.return_value
-    mock_instance.connect = AsyncMock()
-    mock_instance.start_connection = AsyncMock()
-    mock_instance.start_session = AsyncMock()
-    mock_instance.finish_session = AsyncMock()
-    mock_instance.finish_connection = AsyncMock()
-    mock_instance.close = AsyncMock()
+    mock_instance.configure_mock(
+        **{
+            name: AsyncMock()
+            for name in (
+                "connect",
+                "start_connection",
+                "start_session",
+                "finish_session",
+                "finish_connection",
+                "close",
+            )
+        }
+    )
 
     # This async method simulates different behaviors on subsequent calls
     async def mock_send_text_stateful(text: str):
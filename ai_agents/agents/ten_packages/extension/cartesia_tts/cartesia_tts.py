@@ -241,9 +241,12 @@ class CartesiaTTSClient:
 
         while not self._closing:
             try:
-                connection_start = time.time()
+                # monotonic: durations must not jump with wall-clock changes
+                connection_start = time.monotonic()
                 await self._connect()
-                connection_ms = int((time.time() - connection_start) * 1000)
+                connection_ms = int(
+                    (time.monotonic() - connection_start) * 1000
+                )
 
                 if self.latency_metrics_callback:
                     await self.latency_metrics_callback(connection_ms)
@@ -425,7 +428,7 @@ class CartesiaTTSClient:
 
         # Track request start time for TTFB
         if context_id not in self._request_start_times:
-            self._request_start_times[context_id] = time.time()
+            self._request_start_times[context_id] = time.monotonic()
 
         if t.text_input_end:
             # For the final text, set continue=False to signal end of context
@@ -548,7 +551,7 @@ class CartesiaTTSClient:
                 if context_id and context_id not in self._ttfb_sent:
                     start_time = self._request_start_times.get(context_id)
                     if start_time:
-                        ttfb_ms = int((time.time() - start_time) * 1000)
+                        ttfb_ms = int((time.monotonic() - start_time) * 1000)
                         self._ttfb_sent.add(context_id)
                         self.ten_env.log_debug(
                             f"vendor_status: TTFB for {context_id}: {ttfb_ms}ms",
@@ -570,14 +573,8 @@ class CartesiaTTSClient:
                 # Accumulate samples (16-bit PCM mono: 2 bytes per sample)
                 self._all_samples += float(len(audio_bytes)) / 2 * 1000
 
-                self.ten_env.log_debug(
-                    f"receive_audio: context={context_id}, "
-                    f"len={len(audio_bytes)}, "
-                    f"pcm_start_ms={cur_pcm_start_ms}, "
-                    f"base_ms={int(self._base_start_ms)}, "
-                    f"all_samples={self._all_samples:.0f}",
-                    category=LOG_CATEGORY_VENDOR,
-                )
+                # No per-chunk logging: the f-string would be formatted for
+                # every audio chunk even when debug logging is filtered out.
                 await self.pcm_queue.put(
                     (audio_bytes, context_id, cur_pcm_start_ms)
                 )
@@ -13,6 +13,9 @@ class CosyTTSConfig(BaseModel):
     voice: str = ""  # Voice name
     sample_rate: int = 16000  # Audio sample rate
     url: str = ""  # DashScope WebSocket URL
+    # Open the WebSocket as soon as the client starts instead of letting the
+    # first utterance absorb the handshake round trip.
+    pre_connect: bool = False
 
     # Debug and dump settings
     dump: bool = False
@@ -49,6 +52,7 @@ class CosyTTSConfig(BaseModel):
             "sample_rate",
             "voice",
             "url",
+            "pre_connect",
         ]
 
         for param_name in param_names:
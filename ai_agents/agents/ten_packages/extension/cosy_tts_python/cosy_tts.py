@@ -1,5 +1,5 @@
 import asyncio
-from datetime import datetime
+import time
 
 import dashscope
 from dashscope.audio.tts_v2 import (
@@ -32,6 +32,11 @@ AUDIO_FORMAT_MAPPING = {
 }
 DEFAULT_AUDIO_FORMAT = AudioFormat.PCM_16000HZ_MONO_16BIT
 
+# Bound on the receive queue: ~2 s of coalesced ~20 ms packets plus headroom
+# for control messages. If the consumer stalls, audio is dropped instead of
+# letting buffered PCM inflate RSS without limit.
+RECEIVE_QUEUE_MAXSIZE = 128
+
 
 class CosyTTSTaskFailedException(Exception):
     """Exception raised when Cosy TTS task fails"""
@@ -52,13 +57,59 @@ class AsyncIteratorCallback(ResultCallback):
         self,
         ten_env: AsyncTenEnv,
         queue: asyncio.Queue[tuple[bool, int, str | bytes | None]],
+        loop: asyncio.AbstractEventLoop,
+        min_packet_bytes: int = 0,
     ) -> None:
         self.ten_env = ten_env
 
         self._closed = False
         self._cancelled = False
-        self._loop = asyncio.get_event_loop()
+        # The owner passes its running loop explicitly: get_event_loop()
+        # is deprecated off the loop thread and may create a new loop.
+        self._loop = loop
         self._queue = queue
+        # Coalesce vendor packets smaller than this before queueing, so a
+        # burst of tiny frames costs one loop wakeup instead of one each.
+        # 0 disables coalescing. Only the SDK callback thread touches the
+        # buffer.
+        self._min_packet_bytes = min_packet_bytes
+        self._pcm_buf = bytearray()
+
+    def _put_threadsafe(
+        self, item: tuple[bool, int, str | bytes | None]
+    ) -> None:
+        """Hand an item to the loop from the SDK callback thread.
+
+        call_soon_threadsafe + put_nowait just schedules one callback;
+        run_coroutine_threadsafe built a coroutine plus a concurrent.futures
+        Future per packet to await a put that never blocks.
+        """
+        self._loop.call_soon_threadsafe(self._try_put, item)
+
+    def _try_put(self, item: tuple[bool, int, str | bytes | None]) -> None:
+        """Runs on the loop: enqueue, shedding audio when the queue is full."""
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            if item[1] == MESSAGE_TYPE_PCM:
+                self.ten_env.log_warn(
+                    "Receive queue full, dropping PCM packet: consumer too slow"
+                )
+                return
+            # Control messages must get through: evict the oldest item.
+            try:
+                self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            self._queue.put_nowait(item)
+
+    def _flush_pcm(self) -> None:
+        """Queue whatever audio is still buffered below the threshold."""
+        if self._pcm_buf:
+            self._put_threadsafe(
+                (False, MESSAGE_TYPE_PCM, bytes(self._pcm_buf))
+            )
+            self._pcm_buf.clear()
 
     def close(self):
         """Close the callback."""
@@ -81,10 +132,8 @@ class AsyncIteratorCallback(ResultCallback):
 
         # Send completion signal only if not cancelled
         if not self._cancelled:
-            asyncio.run_coroutine_threadsafe(
-                self._queue.put((True, MESSAGE_TYPE_CMD_COMPLETE, None)),
-                self._loop,
-            )
+            self._flush_pcm()
+            self._put_threadsafe((True, MESSAGE_TYPE_CMD_COMPLETE, None))
 
     def on_error(self, message: str):
         """Called when TTS synthesis encounters an error."""
@@ -92,14 +141,14 @@ class AsyncIteratorCallback(ResultCallback):
 
         # Send error signal only if not cancelled
         if not self._cancelled:
-            asyncio.run_coroutine_threadsafe(
-                self._queue.put((False, MESSAGE_TYPE_CMD_ERROR, message)),
-                self._loop,
-            )
+            self._flush_pcm()
+            self._put_threadsafe((False, MESSAGE_TYPE_CMD_ERROR, message))
 
     def on_close(self):
         """Called when WebSocket connection closes."""
         self.ten_env.log_info("WebSocket connection closed.")
+        if not self._cancelled:
+            self._flush_pcm()
         self.close()
 
     def on_event(self, message: str) -> None:
@@ -117,15 +166,12 @@ class AsyncIteratorCallback(ResultCallback):
                         .get("characters")
                     )
                     if isinstance(char_count, int):
-                        asyncio.run_coroutine_threadsafe(
-                            self._queue.put(
-                                (
-                                    False,
-                                    MESSAGE_TYPE_CMD_RESULT_GENERATED,
-                                    char_count,
-                                )
-                            ),
-                            self._loop,
+                        self._put_threadsafe(
+                            (
+                                False,
+                                MESSAGE_TYPE_CMD_RESULT_GENERATED,
+                                char_count,
+                            )
                         )
             except json.JSONDecodeError:
                 self.ten_env.log_error("Failed to decode TTS event JSON")
@@ -146,11 +192,18 @@ class AsyncIteratorCallback(ResultCallback):
             )
             return
 
-        self.ten_env.log_info(f"Received audio data: {len(data)} bytes")
-        # Send audio data to queue
-        asyncio.run_coroutine_threadsafe(
-            self._queue.put((False, MESSAGE_TYPE_PCM, data)), self._loop
-        )
+        # No per-packet log here: formatting a line for every vendor frame
+        # burned CPU on the audio path.
+        if self._min_packet_bytes <= 0:
+            self._put_threadsafe((False, MESSAGE_TYPE_PCM, data))
+            return
+
+        self._pcm_buf.extend(data)
+        if len(self._pcm_buf) >= self._min_packet_bytes:
+            self._put_threadsafe(
+                (False, MESSAGE_TYPE_PCM, bytes(self._pcm_buf))
+            )
+            self._pcm_buf.clear()
 
 
 class CosyTTSClient:
@@ -174,7 +227,7 @@ class CosyTTSClient:
         # Communication queue for audio data
         self._receive_queue: asyncio.Queue[
             tuple[bool, int, str | bytes | None]
-        ] = asyncio.Queue()
+        ] = asyncio.Queue(maxsize=RECEIVE_QUEUE_MAXSIZE)
 
         # Set dashscope API key
         dashscope.api_key = config.api_key
@@ -183,8 +236,12 @@ class CosyTTSClient:
         """Start the TTS client and initialize components."""
 
         # Initialize audio data queue
+        # Coalesce vendor packets up to ~20 ms of PCM (16-bit mono).
         self._callback = AsyncIteratorCallback(
-            self.ten_env, self._receive_queue
+            self.ten_env,
+            self._receive_queue,
+            asyncio.get_running_loop(),
+            min_packet_bytes=self.config.sample_rate * 2 * 20 // 1000,
         )
 
         # Create synthesizer with configuration
@@ -196,15 +253,34 @@ class CosyTTSClient:
             url=self.config.url or None,
         )
 
+        # Optional warmup: an empty streaming call forces the WebSocket
+        # handshake now so the first real utterance does not pay for it.
+        # Off by default to keep start() itself cheap.
+        if self.config.pre_connect:
+            self.synthesizer.streaming_call("")
+
         self.ten_env.log_info("Cosy TTS client started successfully")
 
     def cancel(self) -> None:
         """
         Cancel current TTS operation.
         """
+        # Stop the producer first, then swap in a fresh queue: reassignment
+        # drops any buffered frames in O(1) instead of looping get_nowait
+        # over them. A CANCEL message on the old queue wakes a consumer that
+        # is already blocked on it; subsequent get_audio_data() calls read
+        # the new queue.
         if self._callback:
             self._callback.cancel()
 
+        old_queue = self._receive_queue
+        self._receive_queue = asyncio.Queue(maxsize=RECEIVE_QUEUE_MAXSIZE)
+        if old_queue.full():
+            # Make room for the wake-up message; the buffered frame being
+            # evicted was about to be discarded anyway.
+            old_queue.get_nowait()
+        old_queue.put_nowait((False, MESSAGE_TYPE_CMD_CANCEL, None))
+
         if self.synthesizer:
             try:
                 self.synthesizer.streaming_cancel()
@@ -263,30 +339,30 @@ class CosyTTSClient:
         """
         return await self._receive_queue.get()
 
-    def _duration_in_ms(self, start: datetime, end: datetime) -> int:
+    def _duration_in_ms(self, start_ns: int, end_ns: int) -> int:
         """
-        Calculate duration between two timestamps in milliseconds.
+        Calculate duration between two monotonic timestamps in milliseconds.
 
         Args:
-            start: Start timestamp
-            end: End timestamp
+            start_ns: Start timestamp from time.monotonic_ns()
+            end_ns: End timestamp from time.monotonic_ns()
 
         Returns:
             Duration in milliseconds
         """
-        return int((end - start).total_seconds() * 1000)
+        return (end_ns - start_ns) // 1_000_000
 
-    def _duration_in_ms_since(self, start: datetime) -> int:
+    def _duration_in_ms_since(self, start_ns: int) -> int:
         """
-        Calculate duration from a timestamp to now in milliseconds.
+        Calculate duration from a monotonic timestamp to now in milliseconds.
 
         Args:
-            start: Start timestamp
+            start_ns: Start timestamp from time.monotonic_ns()
 
         Returns:
             Duration in milliseconds from start to now
         """
-        return self._duration_in_ms(start, datetime.now())
+        return self._duration_in_ms(start_ns, time.monotonic_ns())
 
     def _get_audio_format(self) -> AudioFormat:
         """
@@ -295,11 +371,12 @@ class CosyTTSClient:
         Returns:
             AudioFormat: The appropriate audio format for the configuration
         """
-        if self.config.sample_rate in AUDIO_FORMAT_MAPPING:
-            return AUDIO_FORMAT_MAPPING[self.config.sample_rate]
-
-        # Fallback to default format if configuration not supported
-        self.ten_env.log_warn(
-            f"Unsupported audio format: {self.config.sample_rate}Hz, using default format: PCM_16000HZ_MONO_16BIT"
-        )
-        return DEFAULT_AUDIO_FORMAT
+        # Single dict lookup instead of a membership test plus indexing.
+        audio_format = AUDIO_FORMAT_MAPPING.get(self.config.sample_rate)
+        if audio_format is None:
+            # Fallback to default format if configuration not supported
+            self.ten_env.log_warn(
+                f"Unsupported audio format: {self.config.sample_rate}Hz, using default format: PCM_16000HZ_MONO_16BIT"
+            )
+            return DEFAULT_AUDIO_FORMAT
+        return audio_format
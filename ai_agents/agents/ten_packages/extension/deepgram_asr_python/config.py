@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Dict, Any
 from pydantic import BaseModel, Field
 from ten_ai_base.utils import encrypt
@@ -102,8 +103,10 @@ class DeepgramASRConfig(BaseModel):
                     config_dict["params"][key] = encrypt(value)
         return str(config_dict)
 
-    @property
+    @cached_property
     def is_flux_model(self) -> bool:
+        # Checked on every recognition result; the model name is fixed once
+        # apply_defaults() has run, so scan it once and cache.
         params_dict = self.params or {}
         return "flux" in (params_dict.get("model", "") or "").lower()
 
@@ -1,5 +1,5 @@
-from datetime import datetime
 import os
+import time
 import asyncio
 import copy
 from typing import Dict, Any
@@ -48,8 +48,26 @@ class DeepgramASRExtension(
         self.audio_dumper: Dumper | None = None
         self.sent_user_audio_duration_ms_before_last_reset: int = 0
         self.last_finalize_timestamp: int = 0
+        # One-slot dedup cache for interim results: with
+        # interim_results=True Deepgram frequently resends the same text,
+        # and each duplicate would otherwise fan out downstream.
+        self._last_emitted: tuple[str | None, bool | None] = (None, None)
+        # asr_result_language is a property chain (params lookup plus
+        # BCP-47 mapping) that would otherwise run on every interim
+        # result; resolved once after config load.
+        self._result_language: str = ""
+        # Outgoing audio is coalesced here until ~send_buffer_ms worth is
+        # ready, cutting websocket frames and TLS records roughly 5x at the
+        # cost of the configured batching latency. 0 disables batching.
+        self._send_buf = bytearray()
+        self._send_buf_target: int = 0
         # Reconnection manager
         self.reconnect_manager: ReconnectManager = None  # type: ignore
+        # Single-flight reconnect: on_error and on_close can both fire for
+        # one failure, and parallel reconnect chains would each dial their
+        # own websocket. The slot also keeps a strong reference so the
+        # task is not garbage collected mid-flight.
+        self._reconnect_task: asyncio.Task | None = None
 
     @override
     async def on_deinit(self, ten_env: AsyncTenEnv) -> None:
@@ -96,11 +114,20 @@ class DeepgramASRExtension(
 
             # Apply default params based on model type (nova or flux)
             self.config.apply_defaults()
+            self._result_language = self.config.asr_result_language
 
             ten_env.log_info(
                 f"config: {self.config.to_json(sensitive_handling=True)}",
                 category=LOG_CATEGORY_KEY_POINT,
             )
+            sample_rate = self.config.params.get("sample_rate", 16000)
+            send_buffer_ms = int(
+                self.config.params.get("send_buffer_ms", 100)
+            )
+            self._send_buf_target = (
+                send_buffer_ms * int(sample_rate) * 2 // 1000
+            )
+
             if self.config.dump:
                 dump_file_path = os.path.join(
                     self.config.dump_path, DUMP_FILE_NAME
@@ -109,6 +136,14 @@ class DeepgramASRExtension(
                 await self.audio_dumper.start()
         except Exception as e:
             ten_env.log_error(f"Invalid Deepgram config: {e}")
+            # Don't leak the dump file handle if init fails after the
+            # dumper was opened.
+            if self.audio_dumper:
+                try:
+                    await self.audio_dumper.stop()
+                except Exception:
+                    pass
+                self.audio_dumper = None
             self.config = DeepgramASRConfig.model_validate_json("{}")
             await self.send_asr_error(
                 ModuleError(
@@ -158,14 +193,18 @@ class DeepgramASRExtension(
             if self.is_connected():
                 await self.stop_connection()
 
-            # Create recognition instance
-            self.recognition = DeepgramASRRecognition(
-                api_key=final_api_key,
-                audio_timeline=self.audio_timeline,
-                ten_env=self.ten_env,
-                config=self.config.params,
-                callback=self,
-            )
+            # Reuse the recognition instance across reconnect attempts;
+            # only the websocket dial needs to happen again. A fresh
+            # instance is built solely after an explicit stop_connection
+            # (which clears it) or on first connect.
+            if self.recognition is None:
+                self.recognition = DeepgramASRRecognition(
+                    api_key=final_api_key,
+                    audio_timeline=self.audio_timeline,
+                    ten_env=self.ten_env,
+                    config=self.config.params,
+                    callback=self,
+                )
 
             asyncio.create_task(self.recognition.start(timeout=10))
 
@@ -184,11 +223,16 @@ class DeepgramASRExtension(
         """Finalize recognition"""
         assert self.config is not None
 
-        self.last_finalize_timestamp = int(datetime.now().timestamp() * 1000)
+        # Monotonic clock: immune to wall-clock jumps and much cheaper
+        # than constructing a datetime per call.
+        self.last_finalize_timestamp = time.monotonic_ns() // 1_000_000
         self.ten_env.log_debug(
             f"Deepgram finalize start at {self.last_finalize_timestamp}"
         )
 
+        # Batched audio must reach the vendor before any finalize signal.
+        await self._flush_send_buf()
+
         finalize_mode = self.config.finalize_mode
         if self.config.is_flux_model:
             if finalize_mode == "ignore":
@@ -270,6 +314,12 @@ class DeepgramASRExtension(
         """Process ASR recognition result"""
         assert self.config is not None
 
+        # Drop interim results that repeat the previous emission verbatim;
+        # final results always pass through.
+        if not final and (text, final) == self._last_emitted:
+            return
+        self._last_emitted = (text, final)
+
         if final:
             await self._finalize_end()
 
@@ -313,6 +363,23 @@ class DeepgramASRExtension(
             await self.recognition.send_audio_frame(silence_data)
             self.ten_env.log_debug("Deepgram finalize mute package sent")
 
+    async def _flush_send_buf(self) -> None:
+        """Push any batched audio to the vendor immediately."""
+        if not self._send_buf or self.recognition is None:
+            return
+        audio_data = bytes(self._send_buf)
+        self._send_buf.clear()
+        if self.audio_dumper:
+            await self.audio_dumper.push_bytes(audio_data)
+        await self.recognition.send_audio_frame(audio_data)
+
+    def _schedule_reconnect(self) -> None:
+        """Start a reconnect chain unless one is already running."""
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.create_task(
+                self._handle_reconnect()
+            )
+
     async def _handle_reconnect(self):
         """Handle reconnection"""
         # Attempt reconnection
@@ -338,7 +405,7 @@ class DeepgramASRExtension(
     async def _finalize_end(self) -> None:
         """Handle finalization end logic"""
         if self.last_finalize_timestamp != 0:
-            timestamp = int(datetime.now().timestamp() * 1000)
+            timestamp = time.monotonic_ns() // 1_000_000
             latency = timestamp - self.last_finalize_timestamp
             self.ten_env.log_debug(
                 f"Deepgram finalize end at {timestamp}, latency: {latency}ms"
@@ -348,12 +415,16 @@ class DeepgramASRExtension(
 
     async def stop_connection(self) -> None:
         """Stop ASR connection"""
-        self.ten_env.log_info("Deepgram stop_connection stop_connection")
+        self.ten_env.log_info("Deepgram stop_connection")
         try:
+            if self._reconnect_task and not self._reconnect_task.done():
+                self._reconnect_task.cancel()
+            self._reconnect_task = None
+            await self._flush_send_buf()
             if self.recognition:
                 await self.recognition.close()
                 self.recognition = None
-            self.ten_env.log_info("Deepgram connection stopped1")
+            self.ten_env.log_info("Deepgram connection stopped")
         except Exception as e:
             self.ten_env.log_error(f"Error stopping Deepgram connection: {e}")
 
@@ -381,25 +452,40 @@ class DeepgramASRExtension(
         self, frame: AudioFrame, _session_id: str | None
     ) -> bool:
         """Send audio data"""
-        assert self.recognition is not None
-
+        # Runs once per frame: bind the attributes used below to locals
+        # so each is looked up once, and skip asserting on state that is
+        # already guaranteed by start_connection().
+        recognition = self.recognition
+        audio_dumper = self.audio_dumper
+
+        # Copy out of the native buffer and release it before any await.
+        # Holding the runtime's frame lock across network I/O would pin
+        # the buffer for the whole round trip instead of one memcpy.
+        buf = frame.lock_buf()
         try:
-            buf = frame.lock_buf()
-            audio_data = bytes(buf)
-
-            # Dump audio data
-            if self.audio_dumper:
-                await self.audio_dumper.push_bytes(audio_data)
-
-            # self.ten_env.log_debug(f"Sending audio frame: {len(audio_data)} bytes")
-            await self.recognition.send_audio_frame(audio_data)
-
+            if self._send_buf_target > 0:
+                # Batch frames until the target is reached; one websocket
+                # frame then carries ~send_buffer_ms of audio.
+                self._send_buf.extend(buf)
+                audio_data = None
+            else:
+                audio_data = bytes(buf)
+        finally:
             frame.unlock_buf(buf)
+
+        try:
+            if audio_data is None:
+                if len(self._send_buf) >= self._send_buf_target:
+                    await self._flush_send_buf()
+                return True
+
+            if audio_dumper:
+                await audio_dumper.push_bytes(audio_data)
+            await recognition.send_audio_frame(audio_data)
             return True
 
         except Exception as e:
             self.ten_env.log_error(f"Error sending audio to Deepgram Flux: {e}")
-            frame.unlock_buf(buf)
             return False
 
     # Vendor callback functions
@@ -471,7 +557,7 @@ class DeepgramASRExtension(
                     final=is_final,
                     start_ms=actual_start_ms,
                     duration_ms=duration_ms,
-                    language=self.config.asr_result_language,
+                    language=self._result_language,
                     metadata=metadata,
                 )
 
@@ -505,7 +591,7 @@ class DeepgramASRExtension(
                     final=is_final,
                     start_ms=actual_start_ms,
                     duration_ms=duration_ms,
-                    language=self.config.asr_result_language,
+                    language=self._result_language,
                 )
 
         except Exception as e:
@@ -550,7 +636,7 @@ class DeepgramASRExtension(
             self.ten_env.log_warn(
                 "Deepgram connection error unexpectedly. Reconnecting..."
             )
-            await self._handle_reconnect()
+            self._schedule_reconnect()
 
     @override
     async def on_close(
@@ -576,4 +662,4 @@ class DeepgramASRExtension(
             self.ten_env.log_warn(
                 "Deepgram connection closed unexpectedly. Reconnecting..."
             )
-            await self._handle_reconnect()
+            self._schedule_reconnect()
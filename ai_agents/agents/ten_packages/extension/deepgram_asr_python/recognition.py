@@ -3,6 +3,16 @@ import asyncio
 import websockets
 
 import json
+
+try:
+    # orjson parses the per-message transcript payloads several times
+    # faster than stdlib json; fall back silently when unavailable.
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _loads = json.loads
+
 from .const import TIMEOUT_CODE
 from websockets.protocol import State
 from ten_ai_base.timeline import AudioTimeline
@@ -14,6 +24,11 @@ from ten_runtime import (
 )
 
 
+# Fixed control messages, serialized once at import time.
+KEEPALIVE_MSG = json.dumps({"type": "KeepAlive"})
+FINALIZE_MSG = json.dumps({"type": "Finalize"})
+
+
 class DeepgramASRRecognitionCallback:
     """WebSocket Speech Recognition Callback Interface"""
 
@@ -71,10 +86,21 @@ class DeepgramASRRecognition:
             "flux" in (self.config.get("model", "") or "").lower()
         )
 
+        # Sample rate never changes after init; precompute the divisor used
+        # to turn frame length into milliseconds (16-bit mono) instead of
+        # redoing float division on every audio frame.
+        self._bytes_per_ms = (
+            int(self.config.get("sample_rate", 16000)) * 2 // 1000
+        )
+
         self.websocket = None
         self.is_started = False
         self._message_task = None
 
+        # The config is immutable after init, so the query string only
+        # needs to be assembled once; reconnects reuse the cached URL.
+        self._full_url: str | None = None
+
     async def _keepalive_loop(self):
         """
         WebSocket KeepAlive task: every 5 seconds sends {"type": "KeepAlive"} message when enabled and connected. Exits on error or disconnect.
@@ -86,9 +112,7 @@ class DeepgramASRRecognition:
                     break
                 try:
                     if self.is_flux_model == False:
-                        await self.websocket.send(
-                            json.dumps({"type": "KeepAlive"})
-                        )
+                        await self.websocket.send(KEEPALIVE_MSG)
                         self.ten_env.log_debug(
                             "[KeepAlive] Heartbeat sent",
                             category=LOG_CATEGORY_VENDOR,
@@ -104,19 +128,24 @@ class DeepgramASRRecognition:
     async def _handle_message(self, message):
         """Handle WebSocket message"""
         try:
-            message_data = json.loads(message)
-
-            self.ten_env.log_debug(
-                f"vendor_result: on_recognized: {message}",
-                category=LOG_CATEGORY_VENDOR,
-            )
+            message_data = _loads(message)
 
+            # Only format the payload for messages that are actually
+            # handled; keepalive acks and metadata pings skip the f-string.
             message_type = message_data.get("type")
             if self.is_flux_model == False:
                 if message_type == "Results":
+                    self.ten_env.log_debug(
+                        f"vendor_result: on_recognized: {message}",
+                        category=LOG_CATEGORY_VENDOR,
+                    )
                     await self.callback.on_result(message_data)
             else:
                 if message_type == "TurnInfo":
+                    self.ten_env.log_debug(
+                        f"vendor_result: on_recognized: {message}",
+                        category=LOG_CATEGORY_VENDOR,
+                    )
                     await self.callback.on_result(message_data)
         except Exception as e:
             error_msg = f"Error processing message: {e}"
@@ -143,7 +172,7 @@ class DeepgramASRRecognition:
             )
         except Exception as e:
             error_msg = f"WebSocket message handler error: {e}"
-            self.ten_env.log_info(f"### {error_msg} ###")
+            self.ten_env.log_info(error_msg)
             await self.callback.on_error(error_msg)
         finally:
             self.is_started = False
@@ -165,6 +194,7 @@ class DeepgramASRRecognition:
             "keep_alive",
             "mute_pkg_duration_ms",
             "finalize_mode",
+            "send_buffer_ms",
         }
 
         keywords = []
@@ -203,7 +233,9 @@ class DeepgramASRRecognition:
             self.ten_env.log_info("Recognition already started")
 
         try:
-            url = self.append_query_params(self.url)
+            if self._full_url is None:
+                self._full_url = self.append_query_params(self.url)
+            url = self._full_url
             self.ten_env.log_info(f"Connecting to Deepgram: {url}")
 
             self.websocket = await websockets.connect(
@@ -215,7 +247,7 @@ class DeepgramASRRecognition:
                 open_timeout=timeout,
             )
 
-            self.ten_env.log_info("### WebSocket opened ###")
+            self.ten_env.log_info("WebSocket opened")
             self.is_started = True
 
             self._message_task = asyncio.create_task(self._message_handler())
@@ -253,8 +285,7 @@ class DeepgramASRRecognition:
                 return
 
             # Update timeline based on actual sent bytes
-            sample_rate = self.config.get("sample_rate", 16000)
-            duration_ms = int(len(audio_data) / (sample_rate / 1000 * 2))
+            duration_ms = len(audio_data) // self._bytes_per_ms
             self.audio_timeline.add_user_audio(duration_ms)
 
             # Send audio directly
@@ -282,13 +313,12 @@ class DeepgramASRRecognition:
         try:
             # Send end identifier
             if self.is_flux_model == False:
-                d = {"type": "Finalize"}
                 ws = self.websocket
                 if ws is not None:
-                    await ws.send(json.dumps(d))
+                    await ws.send(FINALIZE_MSG)
                 if self.ten_env:
                     self.ten_env.log_info(
-                        f"vendor_cmd: {json.dumps(d)}",
+                        f"vendor_cmd: {FINALIZE_MSG}",
                         category=LOG_CATEGORY_VENDOR,
                     )
 
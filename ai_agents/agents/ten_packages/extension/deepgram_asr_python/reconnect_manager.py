@@ -1,4 +1,5 @@
 import asyncio
+import random
 from typing import Callable, Awaitable, Optional
 from ten_ai_base.message import ModuleError, ModuleErrorCode
 from .const import MODULE_NAME_ASR
@@ -9,8 +10,10 @@ class ReconnectManager:
     Manages reconnection attempts with unlimited retries and exponential backoff strategy.
 
     Features:
-    - Unlimited retry attempts (will keep retrying until successful)
+    - Unlimited retry attempts by default; optional max_attempts cap
     - Exponential backoff strategy with maximum delay cap: 0.5s, 1s, 2s, 4s (capped)
+    - Random jitter on top of the backoff so a fleet of instances does not
+      retry in lockstep during a provider outage
     - Maximum delay cap to prevent overwhelming the service provider (default: 4s)
     - Automatic counter reset after successful connection
     - Detailed logging for monitoring and debugging
@@ -20,10 +23,12 @@ class ReconnectManager:
         self,
         base_delay: float = 0.5,  # 500 milliseconds
         max_delay: float = 4.0,  # 4 seconds maximum delay
+        max_attempts: Optional[int] = None,  # None = retry forever
         logger=None,
     ):
         self.base_delay = base_delay
         self.max_delay = max_delay
+        self.max_attempts = max_attempts
         self.logger = logger
 
         # State tracking
@@ -67,12 +72,32 @@ class ReconnectManager:
             Note: Actual connection success is determined by callback calling mark_connection_successful()
         """
         self._connection_successful = False
+
+        if (
+            self.max_attempts is not None
+            and self.attempts >= self.max_attempts
+        ):
+            if self.logger:
+                self.logger.log_error(
+                    f"Reconnection abandoned after {self.attempts} attempts"
+                )
+            if error_handler:
+                await error_handler(
+                    ModuleError(
+                        module=MODULE_NAME_ASR,
+                        code=ModuleErrorCode.FATAL_ERROR.value,
+                        message=f"Reconnection abandoned after {self.attempts} attempts",
+                    )
+                )
+            return False
+
         self.attempts += 1
 
         # Calculate exponential backoff delay with max limit: min(2^(attempts-1) * base_delay, max_delay)
+        # plus up to base_delay of jitter to de-synchronize retries.
         delay = min(
             self.base_delay * (2 ** (self.attempts - 1)), self.max_delay
-        )
+        ) + random.uniform(0, self.base_delay)
 
         if self.logger:
             self.logger.log_warn(
@@ -12,6 +12,7 @@ from urllib.parse import urlencode
 import websockets
 from websockets.asyncio.client import ClientConnection
 from websockets.exceptions import InvalidStatus
+from websockets.protocol import State
 
 from .config import DeepgramTTSConfig
 from ten_runtime import AsyncTenEnv
@@ -27,6 +28,10 @@ EVENT_TTS_TTFB_METRIC = 5
 # Seconds to wait for a WebSocket response before timeout
 WS_RECV_TIMEOUT = 8.0
 
+# Fixed control messages, serialized once at import time.
+FLUSH_MSG = json.dumps({"type": "Flush"})
+CLOSE_MSG = json.dumps({"type": "Close"})
+
 
 class DeepgramTTSConnectionException(Exception):
     """Exception raised when Deepgram TTS connection fails"""
@@ -93,7 +98,7 @@ class DeepgramTTSClient:
         self._is_cancelled = True
         if self._ws:
             try:
-                await self._ws.send(json.dumps({"type": "Close"}))
+                await self._ws.send(CLOSE_MSG)
             except Exception:
                 pass
             try:
@@ -113,7 +118,7 @@ class DeepgramTTSClient:
         self.reset_ttfb()
         if self._ws:
             try:
-                await self._ws.send(json.dumps({"type": "Flush"}))
+                await self._ws.send(FLUSH_MSG)
                 # Drain until Flushed to leave connection clean
                 await asyncio.wait_for(self._drain_until_flushed(), timeout=3.0)
             except Exception as e:
@@ -162,10 +167,10 @@ class DeepgramTTSClient:
         # method entry — avoids race with concurrent cancel()
         self._is_cancelled = False
 
-        # Send Speak + Flush
-        speak_msg = {"type": "Speak", "text": text}
-        await self._ws.send(json.dumps(speak_msg))
-        await self._ws.send(json.dumps({"type": "Flush"}))
+        # Send Speak + Flush. The Speak envelope is constant, so only the
+        # text itself goes through the JSON encoder.
+        await self._ws.send(f'{{"type":"Speak","text":{json.dumps(text)}}}')
+        await self._ws.send(FLUSH_MSG)
 
         # Receive audio until Flushed
         try:
@@ -201,9 +206,6 @@ class DeepgramTTSClient:
                         yield ttfb_ms, EVENT_TTS_TTFB_METRIC
                         self._ttfb_sent = True
 
-                    self.ten_env.log_debug(
-                        f"DeepgramTTS: audio chunk, " f"length: {len(message)}"
-                    )
                     yield message, EVENT_TTS_RESPONSE
                 else:
                     try:
@@ -280,8 +282,18 @@ class DeepgramTTSClient:
             raise
 
     async def _ensure_connection(self) -> None:
-        if not self._ws:
-            await self._connect()
+        # The library's own ping keepalive closes dead links in the
+        # background, so checking the resulting state is a sufficient
+        # liveness test — no app-level ping round trip needed.
+        if self._ws is not None and self._ws.state is State.OPEN:
+            return
+        if self._ws is not None:
+            try:
+                await self._ws.close()
+            except Exception:
+                pass
+            self._ws = None
+        await self._connect()
 
     async def _reconnect(self) -> None:
         """Close and re-establish the connection."""
@@ -12,6 +12,20 @@ import re
 
 import numpy as np
 from typing import List, Any, AsyncGenerator
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    # Minimal deployments may not ship orjson; fall back to stdlib json.
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
 from dataclasses import dataclass, field
 from pydantic import BaseModel
 
@@ -150,6 +164,9 @@ class AsyncGlueExtension(AsyncLLMBaseExtension):
 
         self.remote_stream_id: int = 999
 
+        self._session: aiohttp.ClientSession | None = None
+        self._payload_template: dict[str, Any] = {}
+
     async def on_init(self, ten_env: AsyncTenEnv) -> None:
         await super().on_init(ten_env)
         ten_env.log_debug("on_init")
@@ -165,6 +182,17 @@ class AsyncGlueExtension(AsyncLLMBaseExtension):
 
         self.memory = ChatMemory(self.config.max_history)
 
+        # Everything in the chat payload except messages/tools is fixed once
+        # the config is loaded; build it here instead of per request.
+        self._payload_template = {
+            "model": "gpt-3.5-turbo",
+            "stream": True,
+            "stream_options": {"include_usage": True},
+            "ssml_enabled": self.config.ssml_enabled,
+        }
+        if self.config.context_enabled:
+            self._payload_template["context"] = {**self.config.extra_context}
+
         if self.config.enable_storage:
             [result, _] = await ten_env.send_cmd(Cmd.create("retrieve"))
             if result.get_status_code() == StatusCode.OK:
@@ -190,6 +218,10 @@ class AsyncGlueExtension(AsyncLLMBaseExtension):
         self.stopped = True
         await self.queue.put(None)
 
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     async def on_deinit(self, ten_env: AsyncTenEnv) -> None:
         await super().on_deinit(ten_env)
         ten_env.log_debug("on_deinit")
@@ -468,60 +500,72 @@ class AsyncGlueExtension(AsyncLLMBaseExtension):
         data.set_property_bool(DATA_OUT_TEXT_DATA_PROPERTY_END_OF_SEGMENT, True)
         asyncio.create_task(self.ten_env.send_data(data))
 
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Lazily create the shared aiohttp session.
+
+        Creating a session per chat request pays the TCP + TLS handshake on
+        every completion; a single pooled session with keep-alive reuses the
+        connection across requests.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                keepalive_timeout=600,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
     async def _stream_chat(
         self, messages: List[Any], tools: List[Any]
     ) -> AsyncGenerator[dict, None]:
-        async with aiohttp.ClientSession() as session:
-            try:
-                payload = {
-                    "messages": messages,
-                    "tools": tools,
-                    "tools_choice": "auto" if tools else "none",
-                    "model": "gpt-3.5-turbo",
-                    "stream": True,
-                    "stream_options": {"include_usage": True},
-                    "ssml_enabled": self.config.ssml_enabled,
-                }
-                if self.config.context_enabled:
-                    payload["context"] = {**self.config.extra_context}
-                self.ten_env.log_info(
-                    f"payload before sending: {json.dumps(payload)}"
-                )
-                headers = {
-                    "Authorization": f"Bearer {self.config.token}",
-                    "Content-Type": "application/json",
-                }
+        session = await self._ensure_session()
+        try:
+            payload = {
+                **self._payload_template,
+                "messages": messages,
+                "tools": tools,
+                "tools_choice": "auto" if tools else "none",
+            }
+            headers = {
+                "Authorization": f"Bearer {self.config.token}",
+                "Content-Type": "application/json",
+            }
 
-                start_time = time.time()
-                async with session.post(
-                    self.config.api_url, json=payload, headers=headers
-                ) as response:
-                    if response.status != 200:
-                        r = await response.json()
-                        self.ten_env.log_error(
-                            f"Received unexpected status {r} from the server."
-                        )
-                        if self.config.failure_info:
-                            await self._send_text(self.config.failure_info)
-                        return
-                    end_time = time.time()
-                    self.connect_times.append(end_time - start_time)
-
-                    async for line in response.content:
-                        if line:
-                            l = line.decode("utf-8").strip()
-                            if l.startswith("data:"):
-                                content = l[5:].strip()
-                                if content == "[DONE]":
-                                    break
-                                self.ten_env.log_debug(f"content: {content}")
-                                yield json.loads(content)
-            except Exception as e:
-                traceback.print_exc()
-                self.ten_env.log_error(f"Failed to handle {e}")
-            finally:
-                await session.close()
-                session = None
+            start_time = time.time()
+            # Serialize with orjson when available; headers already carry
+            # Content-Type: application/json. Log the already-serialized
+            # body at debug level instead of re-dumping it at info.
+            body = _dumps(payload)
+            self.ten_env.log_debug(f"payload before sending: {body!r}")
+            async with session.post(
+                self.config.api_url, data=body, headers=headers
+            ) as response:
+                if response.status != 200:
+                    r = await response.json()
+                    self.ten_env.log_error(
+                        f"Received unexpected status {r} from the server."
+                    )
+                    if self.config.failure_info:
+                        await self._send_text(self.config.failure_info)
+                    return
+                end_time = time.time()
+                self.connect_times.append(end_time - start_time)
+
+                async for line in response.content:
+                    if line:
+                        l = line.decode("utf-8").strip()
+                        if l.startswith("data:"):
+                            content = l[5:].strip()
+                            if content == "[DONE]":
+                                break
+                            # No per-line log here: formatting every SSE
+                            # delta burned CPU on the hot streaming path.
+                            yield _loads(content)
+        except Exception as e:
+            traceback.print_exc()
+            self.ten_env.log_error(f"Failed to handle {e}")
 
     async def _update_usage(self, usage: LLMUsage) -> None:
         if not self.config.rtm_enabled:
@@ -28,6 +28,7 @@ class InworldTTSExtension(AsyncTTS2HttpExtension):
         # Type hints for better IDE support
         self.config: InworldTTSConfig = None
         self.client: InworldTTSClient = None
+        self._sample_rate: int | None = None
 
     # ============================================================
     # Required method implementations
@@ -49,7 +50,13 @@ class InworldTTSExtension(AsyncTTS2HttpExtension):
 
     def synthesize_audio_sample_rate(self) -> int:
         """Return the sample rate for synthesized audio."""
-        # Use configured sample rate or default to 24000
-        if self.config and self.config.params:
-            return self.config.params.get("sample_rate", 24000)
-        return 24000
+        # This is called per audio frame; cache the configured value so the
+        # hot path skips the dict lookup after the first call.
+        if self._sample_rate is None:
+            if self.config and self.config.params:
+                self._sample_rate = self.config.params.get(
+                    "sample_rate", 24000
+                )
+            else:
+                self._sample_rate = 24000
+        return self._sample_rate
@@ -4,10 +4,22 @@
 # See the LICENSE file for more information.
 #
 from typing import Any, AsyncIterator, Tuple
+import asyncio
 import aiohttp
 import base64
 import json
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+    # Minimal deployments may not ship orjson; fall back to stdlib json.
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 from ten_runtime import AsyncTenEnv
 from ten_ai_base.const import LOG_CATEGORY_VENDOR
 from ten_ai_base.struct import TTS2HttpResponseEventType
@@ -22,6 +34,13 @@ NUMBER_OF_CHANNELS = 1
 # Inworld TTS API endpoints
 INWORLD_TTS_STREAM_URL = "https://api.inworld.ai/tts/v1/voice:stream"
 
+# Reused across requests so the timeout object is not rebuilt per call.
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=60)
+
+# Constant error payload, encoded once at import time.
+_INVALID_KEY_MSG = "Invalid API key"
+_INVALID_KEY_MSG_BYTES = _INVALID_KEY_MSG.encode("utf-8")
+
 
 class InworldTTSClient(AsyncTTS2HttpClient):
     def __init__(
@@ -32,46 +51,101 @@ class InworldTTSClient(AsyncTTS2HttpClient):
         super().__init__()
         self.config = config
         self.ten_env: AsyncTenEnv = ten_env
-        self._is_cancelled = False
+        # Cancellation is tracked per in-flight request so a cancel can never
+        # race with a concurrent get() resetting a shared flag.
+        self._cancel_events: dict[str, asyncio.Event] = {}
         self._session: aiohttp.ClientSession | None = None
 
-        try:
-            api_key = config.params.get("api_key", "")
-            if not api_key:
-                raise ValueError("API key is required for Inworld TTS")
-
-            # Create aiohttp session with auth header
-            self._headers = {
-                "Authorization": f"Basic {api_key}",
-                "Content-Type": "application/json",
-            }
-            ten_env.log_info("InworldTTS client initialized successfully")
-        except Exception as e:
+        # No broad try/except here: nothing below raises under normal
+        # conditions, and wrapping real configuration bugs in a generic
+        # RuntimeError would only hide them.
+        api_key = config.params.get("api_key", "")
+        if not api_key:
             ten_env.log_error(
-                f"error when initializing InworldTTS: {e}",
+                "API key is required for Inworld TTS",
                 category=LOG_CATEGORY_VENDOR,
             )
-            raise RuntimeError(
-                f"error when initializing InworldTTS: {e}"
-            ) from e
+            raise ValueError("API key is required for Inworld TTS")
+
+        # Headers for the lazily created aiohttp session
+        self._headers = {
+            "Authorization": f"Basic {api_key}",
+            "Content-Type": "application/json",
+            # Compressing already-compact NDJSON audio chunks just adds
+            # decompression latency on the TTFB path; ask for plain bytes.
+            "Accept-Encoding": "identity",
+        }
+
+        # Config never changes after init, so build everything except the
+        # text once instead of re-reading params on every request.
+        params = config.params
+        payload_template = {
+            "voice": params.get("voice", "Ashley"),
+            "model": params.get("model", "inworld-tts-1.5-max"),
+            "outputSpec": {
+                "encoding": params.get("encoding", "LINEAR16"),
+                "sampleRateHertz": params.get("sample_rate", 24000),
+            },
+        }
+        if "temperature" in params:
+            payload_template["temperature"] = params["temperature"]
+        if "speaking_rate" in params:
+            payload_template["speakingRate"] = params["speaking_rate"]
+        if "text_normalization" in params:
+            payload_template["textNormalization"] = params[
+                "text_normalization"
+            ]
+        self._payload_template = payload_template
+
+        # Coalesce decoded audio into at least frame_duration_ms worth of
+        # bytes per emitted event. Many NDJSON lines carry only a few
+        # milliseconds of audio; batching them cuts per-event overhead
+        # downstream. Set frame_duration_ms to 0 to emit chunks as decoded.
+        frame_duration_ms = params.get("frame_duration_ms", 20)
+        bytes_per_ms = (
+            params.get("sample_rate", 24000)
+            * BYTES_PER_SAMPLE
+            * NUMBER_OF_CHANNELS
+            // 1000
+        )
+        self._min_emit_bytes = int(frame_duration_ms * bytes_per_ms)
+
+        ten_env.log_info("InworldTTS client initialized successfully")
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
-        """Ensure aiohttp session exists."""
+        """Ensure aiohttp session exists.
+
+        The session is created once and reused across requests with a tuned
+        connector so DNS lookups, TCP connects, and TLS handshakes are
+        amortized instead of paid on every request's TTFB path.
+        """
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(headers=self._headers)
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                headers=self._headers,
+                connector=connector,
+                timeout=REQUEST_TIMEOUT,
+            )
         return self._session
 
     async def cancel(self):
         self.ten_env.log_debug("InworldTTS: cancel() called.")
-        self._is_cancelled = True
+        for event in self._cancel_events.values():
+            event.set()
 
     async def get(
         self, text: str, request_id: str
     ) -> AsyncIterator[Tuple[bytes | None, TTS2HttpResponseEventType]]:
         """Process a single TTS request using Inworld API."""
-        self._is_cancelled = False
-
-        if len(text.strip()) == 0:
+        # Strip once and reuse; str.strip() allocates a new string each call.
+        stripped = text.strip()
+        if not stripped:
             self.ten_env.log_warn(
                 f"InworldTTS: empty text for request_id: {request_id}.",
                 category=LOG_CATEGORY_VENDOR,
@@ -79,53 +153,42 @@ class InworldTTSClient(AsyncTTS2HttpClient):
             yield None, TTS2HttpResponseEventType.END
             return
 
+        cancel_event = asyncio.Event()
+        self._cancel_events[request_id] = cancel_event
         try:
             session = await self._ensure_session()
 
-            # Build request payload
-            payload = {
-                "text": text,
-                "voice": self.config.params.get("voice", "Ashley"),
-                "model": self.config.params.get("model", "inworld-tts-1.5-max"),
-                "outputSpec": {
-                    "encoding": self.config.params.get("encoding", "LINEAR16"),
-                    "sampleRateHertz": self.config.params.get(
-                        "sample_rate", 24000
-                    ),
-                },
-            }
-
-            # Add optional parameters
-            if "temperature" in self.config.params:
-                payload["temperature"] = self.config.params["temperature"]
-            if "speaking_rate" in self.config.params:
-                payload["speakingRate"] = self.config.params["speaking_rate"]
-            if "text_normalization" in self.config.params:
-                payload["textNormalization"] = self.config.params[
-                    "text_normalization"
-                ]
+            # Build request payload from the precomputed template; send the
+            # stripped text so the server never sees surrounding whitespace.
+            payload = {**self._payload_template, "text": stripped}
 
             self.ten_env.log_debug(
                 f"InworldTTS: sending request for request_id: {request_id}, "
                 f"voice: {payload['voice']}, model: {payload['model']}"
             )
 
+            # Serialize with orjson when available; the session headers
+            # already carry Content-Type: application/json.
             async with session.post(
-                INWORLD_TTS_STREAM_URL, json=payload
+                INWORLD_TTS_STREAM_URL, data=_dumps(payload)
             ) as response:
                 if response.status == 401:
-                    error_message = "Invalid API key"
                     self.ten_env.log_error(
-                        f"InworldTTS: {error_message} for request_id: {request_id}.",
+                        f"InworldTTS: {_INVALID_KEY_MSG} for request_id: {request_id}.",
                         category=LOG_CATEGORY_VENDOR,
                     )
-                    yield error_message.encode(
-                        "utf-8"
-                    ), TTS2HttpResponseEventType.INVALID_KEY_ERROR
+                    yield _INVALID_KEY_MSG_BYTES, TTS2HttpResponseEventType.INVALID_KEY_ERROR
                     return
 
                 if response.status != 200:
-                    error_text = await response.text()
+                    # Cap the error-body read at 1 KiB: error payloads are
+                    # small, and an unbounded read would stall on a slow or
+                    # hostile upstream. Release the connection right away so
+                    # the pool slot frees up before the error propagates.
+                    error_text = (await response.content.read(1024)).decode(
+                        "utf-8", errors="replace"
+                    )
+                    response.release()
                     error_message = f"API error {response.status}: {error_text}"
                     self.ten_env.log_error(
                         f"InworldTTS: {error_message} for request_id: {request_id}.",
@@ -138,77 +201,103 @@ class InworldTTSClient(AsyncTTS2HttpClient):
 
                 cache_audio_bytes = bytearray()
 
-                # Process streaming response (NDJSON format)
-                async for line in response.content:
-                    if self._is_cancelled:
-                        self.ten_env.log_debug(
-                            f"Cancellation flag detected, sending flush event "
-                            f"and stopping TTS stream of request_id: {request_id}."
-                        )
-                        yield None, TTS2HttpResponseEventType.FLUSH
-                        return
-
-                    line = line.decode("utf-8").strip()
-                    if not line:
-                        continue
+                # Decouple the socket read from the consumer with a small
+                # bounded queue: the reader keeps draining the NDJSON stream
+                # (keeping the TCP window open) while downstream processes
+                # audio, and maxsize caps how much decoded audio can pile up.
+                queue: asyncio.Queue[tuple[bytes | None, str | None] | None] = (
+                    asyncio.Queue(maxsize=4)
+                )
 
+                async def _reader() -> None:
                     try:
-                        data = json.loads(line)
-
-                        # Check for error in response
-                        if "error" in data:
-                            error_message = data["error"].get(
-                                "message", "Unknown error"
+                        while True:
+                            line = await response.content.readline()
+                            if not line:
+                                break
+                            decoded = line.decode("utf-8").strip()
+                            if not decoded:
+                                continue
+                            chunk_result = self._parse_stream_line(
+                                decoded, cache_audio_bytes, request_id
                             )
-                            self.ten_env.log_error(
-                                f"InworldTTS: API error: {error_message} "
-                                f"for request_id: {request_id}.",
-                                category=LOG_CATEGORY_VENDOR,
+                            if chunk_result is None:
+                                continue
+                            await queue.put(chunk_result)
+                            if chunk_result[1] is not None:
+                                # Vendor error ends the stream.
+                                break
+                    finally:
+                        await queue.put(None)
+
+                reader_task = asyncio.create_task(_reader())
+                # Each queue read is raced against the cancel event so a
+                # cancel interrupts the stream immediately instead of
+                # waiting for the next chunk to arrive from the socket.
+                cancel_wait = asyncio.create_task(cancel_event.wait())
+                total_bytes = 0
+                emit_buf = bytearray()
+                try:
+                    while True:
+                        get_task = asyncio.create_task(queue.get())
+                        done, _ = await asyncio.wait(
+                            {get_task, cancel_wait},
+                            return_when=asyncio.FIRST_COMPLETED,
+                        )
+                        if cancel_wait in done:
+                            get_task.cancel()
+                            reader_task.cancel()
+                            # Tear down the socket so the server stops
+                            # streaming audio we will discard anyway.
+                            response.close()
+                            self.ten_env.log_debug(
+                                f"Cancellation flag detected, sending flush event "
+                                f"and stopping TTS stream of request_id: {request_id}."
                             )
+                            yield None, TTS2HttpResponseEventType.FLUSH
+                            return
+
+                        item = get_task.result()
+                        if item is None:
+                            # The sentinel also arrives when the reader
+                            # died mid-stream (disconnect, bad UTF-8 or
+                            # base64). Await the task so such failures
+                            # re-raise into the error handlers below
+                            # instead of ending the stream as a success.
+                            await reader_task
+                            break
+
+                        chunk, error_message = item
+                        if error_message is not None:
                             yield error_message.encode(
                                 "utf-8"
                             ), TTS2HttpResponseEventType.ERROR
                             return
-
-                        # Extract audio data (base64 encoded)
-                        audio_b64 = data.get("audioContent") or data.get(
-                            "audio", {}
-                        ).get("content")
-                        if audio_b64:
-                            chunk = base64.b64decode(audio_b64)
-
-                            self.ten_env.log_debug(
-                                f"InworldTTS: received audio chunk, "
-                                f"length: {len(chunk)} for request_id: {request_id}."
-                            )
-
-                            # Handle byte alignment
-                            if len(cache_audio_bytes) > 0:
-                                chunk = cache_audio_bytes + chunk
-                                cache_audio_bytes = bytearray()
-
-                            left_size = len(chunk) % (
-                                BYTES_PER_SAMPLE * NUMBER_OF_CHANNELS
-                            )
-
-                            if left_size > 0:
-                                cache_audio_bytes = bytearray(
-                                    chunk[-left_size:]
-                                )
-                                chunk = chunk[:-left_size]
-
-                            if len(chunk) > 0:
-                                yield bytes(
-                                    chunk
-                                ), TTS2HttpResponseEventType.RESPONSE
-
-                    except json.JSONDecodeError:
-                        # Skip non-JSON lines
-                        continue
-
-            if not self._is_cancelled:
+                        if chunk:
+                            total_bytes += len(chunk)
+                            if self._min_emit_bytes <= 0:
+                                # chunk is already immutable bytes; yielding
+                                # it directly avoids a per-chunk copy.
+                                yield chunk, TTS2HttpResponseEventType.RESPONSE
+                            else:
+                                emit_buf += chunk
+                                if len(emit_buf) >= self._min_emit_bytes:
+                                    yield bytes(
+                                        emit_buf
+                                    ), TTS2HttpResponseEventType.RESPONSE
+                                    emit_buf.clear()
+                finally:
+                    cancel_wait.cancel()
+                    if not reader_task.done():
+                        reader_task.cancel()
+
+            if not cancel_event.is_set():
+                if emit_buf:
+                    # Flush the sub-frame tail before signalling END.
+                    yield bytes(emit_buf), TTS2HttpResponseEventType.RESPONSE
                 self.ten_env.log_debug(
-                    f"InworldTTS: sending EVENT_TTS_END of request_id: {request_id}."
+                    f"InworldTTS: streamed {total_bytes} bytes, sending "
+                    f"EVENT_TTS_END of request_id: {request_id}."
                 )
                 yield None, TTS2HttpResponseEventType.END
 
@@ -220,7 +309,10 @@ class InworldTTSClient(AsyncTTS2HttpClient):
             )
             yield error_message.encode("utf-8"), TTS2HttpResponseEventType.ERROR
 
-        except Exception as e:
+        except (asyncio.TimeoutError, ValueError, RuntimeError) as e:
+            # Deliberately narrow: a bare `except Exception` would also
+            # swallow programming errors here, and CancelledError must keep
+            # propagating so a caller cancel tears the stream down promptly.
             error_message = str(e)
             self.ten_env.log_error(
                 f"vendor_error: {error_message} of request_id: {request_id}.",
@@ -228,6 +320,60 @@ class InworldTTSClient(AsyncTTS2HttpClient):
             )
             yield error_message.encode("utf-8"), TTS2HttpResponseEventType.ERROR
 
+        finally:
+            self._cancel_events.pop(request_id, None)
+
+    def _parse_stream_line(
+        self, line: str, cache_audio_bytes: bytearray, request_id: str
+    ) -> tuple[bytes | None, str | None] | None:
+        """Parse one NDJSON stream line into a PCM chunk or error message.
+
+        Returns None when the line carries nothing to emit, (chunk, None) for
+        a sample-aligned PCM chunk, or (None, error_message) on a vendor
+        error. Unaligned trailing bytes stay in cache_audio_bytes until the
+        next chunk arrives.
+        """
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            # Skip non-JSON lines
+            return None
+
+        # Check for error in response
+        if "error" in data:
+            error_message = data["error"].get("message", "Unknown error")
+            self.ten_env.log_error(
+                f"InworldTTS: API error: {error_message} "
+                f"for request_id: {request_id}.",
+                category=LOG_CATEGORY_VENDOR,
+            )
+            return None, error_message
+
+        # Extract audio data (base64 encoded)
+        audio_b64 = data.get("audioContent") or data.get("audio", {}).get(
+            "content"
+        )
+        if not audio_b64:
+            return None
+
+        chunk = base64.b64decode(audio_b64)
+
+        # No per-chunk logging here: even a filtered-out log_debug formats
+        # its f-string first, and this runs for every chunk of audio. The
+        # consumer logs one summary per request instead.
+
+        # Handle byte alignment
+        if cache_audio_bytes:
+            chunk = bytes(cache_audio_bytes) + chunk
+            del cache_audio_bytes[:]
+
+        left_size = len(chunk) % (BYTES_PER_SAMPLE * NUMBER_OF_CHANNELS)
+        if left_size > 0:
+            cache_audio_bytes.extend(chunk[-left_size:])
+            chunk = chunk[:-left_size]
+
+        return chunk, None
+
     async def clean(self):
         """Clean up resources"""
         self.ten_env.log_debug("InworldTTS: clean() called.")
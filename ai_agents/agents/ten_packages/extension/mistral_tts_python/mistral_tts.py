@@ -15,6 +15,7 @@ header to buffer before the first samples arrive.
 
 from collections.abc import Mapping
 from typing import Any, AsyncIterator, Tuple
+import asyncio
 import base64
 import json
 import ssl
@@ -27,7 +28,7 @@ import time
 # ============================================================================
 import httpcore  # noqa: F401  # pylint: disable=unused-import  # Note: This import cannot be removed, otherwise it will affect http client initialization time
 import httpx  # noqa: F401  # pylint: disable=unused-import
-from httpx import AsyncClient, Timeout, Limits
+from httpx import AsyncClient, AsyncHTTPTransport, Timeout, Limits
 
 from ten_runtime import AsyncTenEnv
 from ten_ai_base.const import LOG_CATEGORY_VENDOR
@@ -58,6 +59,10 @@ class Float32ToPcm16:
     (< 4 bytes) between feeds so a float is never split across chunk boundaries.
     """
 
+    # One instance per request, touched per chunk: slots drop the per-instance
+    # __dict__ and make the _remainder loads cheaper in the feed loop.
+    __slots__ = ("_remainder",)
+
     def __init__(self) -> None:
         self._remainder = bytearray()  # leftover bytes < one float32 sample
 
@@ -120,23 +125,48 @@ class MistralTTSClient(AsyncTTS2HttpClient):
 
         # Create httpx client reusing the module-level SSL context.
         _start_time = time.time()
+        # retries=1 on the transport transparently re-dials a keep-alive
+        # connection the server silently dropped during a long agent pause,
+        # instead of surfacing a connect error to the request.
         self.client = AsyncClient(
             timeout=Timeout(timeout=60.0),  # TTS may take longer
-            limits=Limits(
-                max_connections=100,
-                max_keepalive_connections=20,
-                keepalive_expiry=600.0,
+            transport=AsyncHTTPTransport(
+                retries=1,
+                http2=True,
+                verify=_GLOBAL_SSL_CONTEXT,
+                limits=Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=600.0,
+                ),
             ),
-            http2=True,
-            verify=_GLOBAL_SSL_CONTEXT,
         )
         _elapsed_ms = (time.time() - _start_time) * 1000
         ten_env.log_debug(f"http client initialized in {_elapsed_ms:.2f}ms")
 
+        # Warm up the connection off the TTFB path so the first real request
+        # reuses a pooled connection instead of paying TLS + H2 setup.
+        try:
+            self._preheat_task: asyncio.Task | None = asyncio.create_task(
+                self._preheat()
+            )
+        except RuntimeError:
+            # No running loop (e.g. constructed synchronously in tests).
+            self._preheat_task = None
+
         ten_env.log_info(
             f"MistralTTS initialized with endpoint: {self.config.url}"
         )
 
+    async def _preheat(self) -> None:
+        """Best-effort connection warm-up issued at client creation."""
+        try:
+            await self.client.head(self.config.url, headers=self.headers)
+        except Exception:
+            # The vendor may reject HEAD; the TCP/TLS handshake has still
+            # happened, which is all this is for.
+            pass
+
     async def cancel(self):
         """Cancel the current TTS request."""
         self.ten_env.log_debug("MistralTTS: cancel() called.")
@@ -158,7 +188,9 @@ class MistralTTSClient(AsyncTTS2HttpClient):
         """
         self._is_cancelled = False
 
-        if len(text.strip()) == 0:
+        # str.isspace() checks emptiness without materializing a stripped
+        # copy, which matters for very long inputs.
+        if not text or text.isspace():
             self.ten_env.log_warn(
                 f"MistralTTS: empty text for request_id: {request_id}.",
                 category=LOG_CATEGORY_VENDOR,
@@ -195,7 +227,15 @@ class MistralTTSClient(AsyncTTS2HttpClient):
 
                 # Handle non-200 status code
                 if response.status_code != 200:
-                    error_body = await response.aread()
+                    # Read at most 4 KB of the error body: it is plenty for
+                    # classification, and an unbounded aread() would stall on
+                    # a slow or hostile upstream.
+                    buf = bytearray()
+                    async for part in response.aiter_bytes(4096):
+                        buf.extend(part)
+                        if len(buf) >= 4096:
+                            break
+                    error_body = bytes(buf)
                     try:
                         error_data = json.loads(error_body)
                         error_info = error_data.get("error", error_data)
@@ -336,6 +376,8 @@ class MistralTTSClient(AsyncTTS2HttpClient):
     async def clean(self):
         """Clean up resources."""
         self.ten_env.log_debug("MistralTTS: clean() called.")
+        if self._preheat_task and not self._preheat_task.done():
+            self._preheat_task.cancel()
         try:
             if self.client:
                 await self.client.aclose()
@@ -63,7 +63,9 @@ class MurfTTSynthesizer:
 
         # Connection management
         self._session_closing = False
-        self.first_chunk_of_connection = True
+        # Remaining bytes of the per-connection 44-byte WAV header still to
+        # consume; handles the header being split across messages.
+        self._header_bytes_to_skip = 44
         self._connect_exp_cnt = 0
         self._max_retries_exceeded = False
         self.websocket_task = None
@@ -138,7 +140,7 @@ class MurfTTSynthesizer:
                 additional_headers=self._build_websocket_headers(),
             ):
                 self.ws = ws
-                self.first_chunk_of_connection = True
+                self._header_bytes_to_skip = 44
                 try:
                     await self._send_voice_config(ws)
                     await self._send_advanced_settings(ws)
@@ -393,17 +395,22 @@ class MurfTTSynthesizer:
 
             if "audio" in data:
                 audio_data = base64.b64decode(data["audio"])
-                # First packet may contain a 44-byte header
-                if self.first_chunk_of_connection:
-                    if len(audio_data) > 44:
-                        audio_data = audio_data[44:]
+                # Each connection's first packets carry a 44-byte WAV header;
+                # consume it with a skip counter so a header split across
+                # messages is still stripped fully, and only the first
+                # message(s) of a connection pay the branch's slice.
+                if self._header_bytes_to_skip:
+                    if len(audio_data) <= self._header_bytes_to_skip:
+                        self._header_bytes_to_skip -= len(audio_data)
+                        audio_data = b""
                     else:
-                        self.ten_env.log_warn(
-                            "First audio chunk too small to strip header; passing through."
-                        )
-                    self.first_chunk_of_connection = False
+                        audio_data = audio_data[self._header_bytes_to_skip :]
+                        self._header_bytes_to_skip = 0
                 # if context is in cleared context ids then skip
-                if context_id in self.cleared_context_ids:
+                if not audio_data:
+                    # Message carried only header bytes; nothing to emit.
+                    pass
+                elif context_id in self.cleared_context_ids:
                     self.ten_env.log_debug(
                         f"Context ID {context_id} is in cleared context IDs, skipping"
                     )
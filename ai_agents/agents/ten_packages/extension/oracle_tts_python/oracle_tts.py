@@ -93,8 +93,12 @@ class OracleTTS:
         )
 
     @staticmethod
-    def _strip_wav_header(audio: bytes) -> bytes:
-        """Strip WAV/RIFF header from complete audio data, returning raw PCM.
+    def _wav_pcm_bounds(audio: bytes) -> tuple[int, int]:
+        """Locate the raw PCM range inside complete WAV/RIFF audio data.
+
+        Returns (start, end) offsets of the PCM payload so callers can slice
+        frames straight out of the original buffer instead of materializing a
+        header-stripped copy of the whole body first.
 
         Oracle TTS with is_stream_enabled=True may declare an inaccurate
         data chunk size in the WAV header. This method handles two cases:
@@ -104,10 +108,10 @@ class OracleTTS:
            -> use all remaining bytes (prevents truncation)
         """
         if len(audio) < 44 or audio[:4] != b"RIFF":
-            return audio
+            return 0, len(audio)
 
         if audio[8:12] != b"WAVE":
-            return audio
+            return 0, len(audio)
 
         pos = 12
         while pos + 8 <= len(audio):
@@ -139,29 +143,30 @@ class OracleTTS:
                 )
 
                 if has_trailing_chunk and chunk_size <= remaining:
-                    pcm = audio[data_start : data_start + chunk_size]
+                    data_end = data_start + chunk_size
                 else:
-                    pcm = audio[data_start:]
+                    data_end = len(audio)
 
                 # Ensure even byte count for 16-bit PCM
-                if len(pcm) % 2 != 0:
-                    pcm = pcm[:-1]
-                return pcm
+                if (data_end - data_start) % 2 != 0:
+                    data_end -= 1
+                return data_start, data_end
 
             pos += 8 + chunk_size
             if pos % 2 == 1:
                 pos += 1
 
-        pcm = audio[44:]
-        if len(pcm) % 2 != 0:
-            pcm = pcm[:-1]
-        return pcm
+        data_end = len(audio)
+        if (data_end - 44) % 2 != 0:
+            data_end -= 1
+        return 44, data_end
 
     def _get_audio_bytes(self, text: str) -> bytes:
-        """Synchronous: call OCI TTS API and return clean raw PCM audio bytes.
+        """Synchronous: call OCI TTS API and return the complete WAV body.
 
-        1. Call Oracle synthesize_speech API
-        2. Strip WAV header (handles both truncation and trailing data)
+        The WAV header is not stripped here; get() locates the PCM range with
+        _wav_pcm_bounds and slices frames out of this buffer directly, which
+        avoids copying the whole body once just to drop the header.
         """
         params = self.config.params
         compartment_id = params.get("compartment_id", "")
@@ -190,7 +195,7 @@ class OracleTTS:
         else:
             raw = bytes(data)
 
-        return self._strip_wav_header(raw)
+        return raw
 
     async def _get_audio_bytes_cancellable(self, text: str) -> bytes | None:
         """Run _get_audio_bytes in a thread, returning None if cancelled.
@@ -240,25 +245,38 @@ class OracleTTS:
                     return
                 ttfb_ms = int((time.time() - start_ts) * 1000)
 
+                pcm_start, pcm_end = self._wav_pcm_bounds(audio_data)
+
                 self.ten_env.log_debug(
                     f"vendor_latency: ttfb={ttfb_ms}ms, "
-                    f"audio_bytes={len(audio_data)}, "
+                    f"audio_bytes={pcm_end - pcm_start}, "
                     f"request_id={request_id}",
                     category=LOG_CATEGORY_VENDOR,
                 )
 
-                if not audio_data:
+                if pcm_end <= pcm_start:
                     yield "No audio content received from Oracle TTS".encode(
                         "utf-8"
                     ), EVENT_TTS_ERROR, None
                     return
 
-                chunk_size = 4096
+                # Progressive chunk schedule: emit ~20 ms of PCM first so the
+                # player starts immediately, then double up to a 200 ms cap
+                # to keep per-chunk overhead low for the rest of the clip.
+                sample_rate = int(
+                    self.config.params.get("sample_rate", 16000)
+                )
+                bytes_per_ms = sample_rate * 2 // 1000  # 16-bit mono
+                chunk_size = 20 * bytes_per_ms
+                max_chunk_size = 200 * bytes_per_ms
                 first_chunk = True
-                for i in range(0, len(audio_data), chunk_size):
+                i = pcm_start
+                while i < pcm_end:
                     if self._is_cancelled:
                         break
-                    chunk = audio_data[i : i + chunk_size]
+                    chunk = audio_data[i : min(i + chunk_size, pcm_end)]
+                    i += chunk_size
+                    chunk_size = min(chunk_size * 2, max_chunk_size)
                     yield chunk, EVENT_TTS_RESPONSE, (
                         ttfb_ms if first_chunk else None
                     )
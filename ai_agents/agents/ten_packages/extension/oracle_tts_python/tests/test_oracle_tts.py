@@ -5,8 +5,13 @@ import pytest
 from oracle_tts_python.oracle_tts import OracleTTS
 
 
-class TestStripWavHeader:
-    """Tests for OracleTTS._strip_wav_header static method."""
+class TestWavPcmBounds:
+    """Tests for OracleTTS._wav_pcm_bounds static method."""
+
+    @staticmethod
+    def _strip(raw: bytes) -> bytes:
+        start, end = OracleTTS._wav_pcm_bounds(raw)
+        return raw[start:end]
 
     @staticmethod
     def _make_wav(
@@ -31,25 +36,25 @@ class TestStripWavHeader:
 
     def test_non_riff_passthrough(self) -> None:
         raw = b"\x01\x02\x03\x04\x05\x06"
-        assert OracleTTS._strip_wav_header(raw) == raw
+        assert self._strip(raw) == raw
 
     def test_short_input_passthrough(self) -> None:
         raw = b"RIFF" + b"\x00" * 10
-        assert OracleTTS._strip_wav_header(raw) == raw
+        assert self._strip(raw) == raw
 
     def test_wrong_wave_id_passthrough(self) -> None:
         raw = b"RIFF" + struct.pack("<I", 100) + b"AVI " + b"\x00" * 100
-        assert OracleTTS._strip_wav_header(raw) == raw
+        assert self._strip(raw) == raw
 
     def test_standard_wav_extracts_pcm(self) -> None:
         pcm = b"\x01\x02" * 100
         wav = self._make_wav(pcm)
-        assert OracleTTS._strip_wav_header(wav) == pcm
+        assert self._strip(wav) == pcm
 
     def test_odd_length_pcm_trimmed(self) -> None:
         pcm = b"\x01\x02\x03"  # 3 bytes, odd
         wav = self._make_wav(pcm)
-        result = OracleTTS._strip_wav_header(wav)
+        result = self._strip(wav)
         assert len(result) % 2 == 0
         assert result == b"\x01\x02"
 
@@ -70,7 +75,7 @@ class TestStripWavHeader:
         data_chunk = b"data" + struct.pack("<I", 0)
         pcm = b"\x01\x02\x03\x04"
         wav = riff + fmt_chunk + data_chunk + pcm
-        assert OracleTTS._strip_wav_header(wav) == pcm
+        assert self._strip(wav) == pcm
 
     def test_trailing_metadata_chunks_excluded(self) -> None:
         """When valid trailing WAV chunks exist after the data chunk,
@@ -79,13 +84,13 @@ class TestStripWavHeader:
         pcm = b"\xaa\xbb" * 50  # 100 bytes of PCM
         trailing = b"LIST" + struct.pack("<I", 4) + b"INFO"
         wav = self._make_wav(pcm, trailing=trailing)
-        result = OracleTTS._strip_wav_header(wav)
+        result = self._strip(wav)
         assert result == pcm
         assert trailing[0:4] not in result
 
     def test_empty_pcm_returns_empty(self) -> None:
         wav = self._make_wav(b"")
-        assert OracleTTS._strip_wav_header(wav) == b""
+        assert self._strip(wav) == b""
 
     def test_large_declared_size_uses_remaining(self) -> None:
         """When chunk_size is larger than remaining data (no valid trailing chunk),
@@ -106,5 +111,5 @@ class TestStripWavHeader:
         body = b"WAVE" + fmt_chunk + data_chunk
         riff_header = b"RIFF" + struct.pack("<I", len(body))
         wav = riff_header + body
-        result = OracleTTS._strip_wav_header(wav)
+        result = self._strip(wav)
         assert result == pcm
@@ -108,7 +108,7 @@ class TestOracleTTSGet:
         response_mock.data.content = b"RIFF" + b"\x00" * 4 + b"XXXX" + pcm_data
         tts.client.synthesize_speech.return_value = response_mock
 
-        tts._strip_wav_header = staticmethod(lambda x: pcm_data)
+        tts._wav_pcm_bounds = staticmethod(lambda x: (12, 12 + len(pcm_data)))
 
         chunks = []
         async for chunk, event, ttfb in tts.get("hello", "req-1"):
@@ -139,7 +139,7 @@ class TestOracleTTSGet:
         response_mock.data.content = pcm_data
         tts.client.synthesize_speech.return_value = response_mock
 
-        tts._strip_wav_header = staticmethod(lambda x: pcm_data)
+        tts._wav_pcm_bounds = staticmethod(lambda x: (0, len(pcm_data)))
 
         events = []
         async for chunk, event, ttfb in tts.get("test", "req-2"):
@@ -162,7 +162,7 @@ class TestOracleTTSGet:
         response_mock = MagicMock()
         response_mock.data.content = pcm_data
         tts.client.synthesize_speech.return_value = response_mock
-        tts._strip_wav_header = staticmethod(lambda x: pcm_data)
+        tts._wav_pcm_bounds = staticmethod(lambda x: (0, len(pcm_data)))
 
         ttfb_values = []
         async for chunk, event, ttfb in tts.get("hello", "req-3"):
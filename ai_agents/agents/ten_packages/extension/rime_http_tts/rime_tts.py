@@ -1,4 +1,5 @@
 from typing import Any, AsyncIterator, Tuple
+import asyncio
 from httpx import AsyncClient, Timeout, Limits
 
 from .config import RimeTTSConfig
@@ -23,6 +24,9 @@ class RimeTTSClient(AsyncTTS2HttpClient):
         self.api_key = config.params.get("api_key", "")
         self.ten_env: AsyncTenEnv = ten_env
         self._is_cancelled = False
+        # Set by cancel(); raced against socket reads so a cancel takes
+        # effect immediately instead of after the next chunk arrives.
+        self._cancel_event = asyncio.Event()
         self.endpoint = config.params.get(
             "endpoint", "https://users.rime.ai/v1/rime-tts"
         )
@@ -30,6 +34,10 @@ class RimeTTSClient(AsyncTTS2HttpClient):
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "Accept": "audio/pcm",
+            # Compressed PCM must be inflated before it can play, which
+            # turns a streaming response into a buffered one; identity
+            # keeps the audio flowing chunk by chunk.
+            "Accept-Encoding": "identity",
         }
         self.client = AsyncClient(
             timeout=Timeout(timeout=20.0),
@@ -44,12 +52,14 @@ class RimeTTSClient(AsyncTTS2HttpClient):
     async def cancel(self):
         self.ten_env.log_debug("RimeTTS: cancel() called.")
         self._is_cancelled = True
+        self._cancel_event.set()
 
     async def get(
         self, text: str, request_id: str
     ) -> AsyncIterator[Tuple[bytes | None, TTS2HttpResponseEventType]]:
         """Process a single TTS request in serial manner"""
         self._is_cancelled = False
+        self._cancel_event = asyncio.Event()
         if not self.client:
             self.ten_env.log_error(
                 f"RimeTTS: client not initialized for request_id: {request_id}.",
@@ -59,7 +69,9 @@ class RimeTTSClient(AsyncTTS2HttpClient):
                 f"RimeTTS: client not initialized for request_id: {request_id}."
             )
 
-        if len(text.strip()) == 0:
+        # str.isspace() checks emptiness without materializing a stripped
+        # copy of the input.
+        if not text or text.isspace():
             self.ten_env.log_warn(
                 f"RimeTTS: empty text for request_id: {request_id}.",
                 category=LOG_CATEGORY_VENDOR,
@@ -81,24 +93,58 @@ class RimeTTSClient(AsyncTTS2HttpClient):
                     **payload,
                 },
             ) as response:
-                async for chunk in response.aiter_bytes(chunk_size=4096):
-                    if self._is_cancelled:
-                        self.ten_env.log_debug(
-                            f"Cancellation flag detected, sending flush event and stopping TTS stream of request_id: {request_id}."
+                # Yield chunks as the network delivers them: re-chunking to a
+                # fixed 4 KB size made httpx slice and buffer every read, and
+                # the per-chunk debug log formatted an f-string for every
+                # piece of audio. Log a single summary after the loop.
+                total_bytes = 0
+                # Holds a trailing odd byte so downstream always sees whole
+                # int16 samples: resamplers crash on buffers that are not a
+                # multiple of the element size.
+                residual = b""
+                iterator = response.aiter_bytes()
+                cancel_wait = asyncio.create_task(self._cancel_event.wait())
+                try:
+                    while True:
+                        read_task = asyncio.create_task(iterator.__anext__())
+                        done, _ = await asyncio.wait(
+                            {read_task, cancel_wait},
+                            return_when=asyncio.FIRST_COMPLETED,
                         )
-                        yield None, TTS2HttpResponseEventType.FLUSH
-                        break
-
-                    self.ten_env.log_debug(
-                        f"RimeTTS: sending EVENT_TTS_RESPONSE, length: {len(chunk)} of request_id: {request_id}."
-                    )
-
-                    if len(chunk) > 0:
-                        yield bytes(chunk), TTS2HttpResponseEventType.RESPONSE
-                    else:
-                        yield None, TTS2HttpResponseEventType.END
+                        if cancel_wait in done:
+                            read_task.cancel()
+                            self.ten_env.log_debug(
+                                f"Cancellation flag detected, sending flush event and stopping TTS stream of request_id: {request_id}."
+                            )
+                            yield None, TTS2HttpResponseEventType.FLUSH
+                            break
+
+                        try:
+                            chunk = read_task.result()
+                        except StopAsyncIteration:
+                            # A lone residual byte at stream end cannot be
+                            # half a sample; drop it.
+                            break
+
+                        if residual:
+                            chunk = residual + chunk
+                            residual = b""
+                        if len(chunk) & 1:
+                            residual = chunk[-1:]
+                            chunk = chunk[:-1]
+
+                        if len(chunk) > 0:
+                            total_bytes += len(chunk)
+                            # aiter_bytes already yields immutable bytes;
+                            # wrapping in bytes() just re-copied every chunk.
+                            yield chunk, TTS2HttpResponseEventType.RESPONSE
+                finally:
+                    cancel_wait.cancel()
 
             if not self._is_cancelled:
+                self.ten_env.log_debug(
+                    f"RimeTTS: streamed {total_bytes} bytes of request_id: {request_id}."
+                )
                 self.ten_env.log_debug(
                     f"RimeTTS: sending EVENT_TTS_END of request_id: {request_id}."
                 )
@@ -1,9 +1,21 @@
 from typing import Any, AsyncIterator, Tuple
 import base64
 import io
+import json
 import wave
 from httpx import AsyncClient, Timeout, Limits
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+    # Minimal deployments may not ship orjson; fall back to stdlib json.
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 from .config import SarvamTTSConfig
 from ten_runtime import AsyncTenEnv
 from ten_ai_base.const import LOG_CATEGORY_VENDOR
@@ -53,6 +65,11 @@ class SarvamTTSClient(AsyncTTS2HttpClient):
             "api-subscription-key": self.api_subscription_key,
             "Content-Type": "application/json",
         }
+        # Params never change after init; copy them once (minus the
+        # subscription key, which travels in the header) instead of
+        # rebuilding the payload dict on every request.
+        self._payload_template = {**config.params}
+        self._payload_template.pop("api_subscription_key", None)
         self.client = AsyncClient(
             timeout=Timeout(timeout=20.0),
             limits=Limits(
@@ -81,7 +98,9 @@ class SarvamTTSClient(AsyncTTS2HttpClient):
                 f"SarvamTTS: client not initialized for request_id: {request_id}."
             )
 
-        if len(text.strip()) == 0:
+        # str.isspace() checks emptiness without materializing a stripped
+        # copy of the input.
+        if not text or text.isspace():
             self.ten_env.log_warn(
                 f"SarvamTTS: empty text for request_id: {request_id}.",
                 category=LOG_CATEGORY_VENDOR,
@@ -90,18 +109,17 @@ class SarvamTTSClient(AsyncTTS2HttpClient):
             return
 
         try:
-            # Shallow copy params and strip api_subscription_key before sending to API
-            payload = {**self.config.params}
-            payload.pop("api_subscription_key", None)
-
-            # Ensure text is in the payload
-            payload["text"] = text
+            # Only the text varies per request; the rest comes from the
+            # template built at init.
+            payload = {**self._payload_template, "text": text}
 
             # Make POST request to Sarvam API
+            # Serialize with orjson when available; self.headers already
+            # carries Content-Type: application/json.
             response = await self.client.post(
                 self.endpoint,
                 headers=self.headers,
-                json=payload,
+                content=_dumps(payload),
             )
 
             if self._is_cancelled:
@@ -118,7 +136,7 @@ class SarvamTTSClient(AsyncTTS2HttpClient):
                     f"vendor_error: {error_message} of request_id: {request_id}.",
                     category=LOG_CATEGORY_VENDOR,
                 )
-                if response.status_code == 401 or response.status_code == 403:
+                if response.status_code in (401, 403):
                     yield error_message.encode(
                         "utf-8"
                     ), TTS2HttpResponseEventType.INVALID_KEY_ERROR
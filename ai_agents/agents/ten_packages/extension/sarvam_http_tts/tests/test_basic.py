@@ -187,6 +187,15 @@ def test_dump_functionality(MockSarvamTTSClient):
 
 
 # ================ test flush logic ================
+# Static payloads serialized once at import time instead of running Pydantic
+# model_dump_json on every send.
+_FLUSH_INPUT_JSON = TTSTextInput(
+    request_id="tts_request_for_flush",
+    text="This is a very long text designed to generate a continuous stream of audio, providing enough time to send a flush command.",
+).model_dump_json()
+_FLUSH_JSON = TTSFlush(flush_id="tts_request_for_flush").model_dump_json()
+
+
 class ExtensionTesterFlush(ExtensionTester):
     def __init__(self):
         super().__init__()
@@ -202,17 +211,18 @@ class ExtensionTesterFlush(ExtensionTester):
         self.sample_rate = 22050  # Sarvam TTS sample rate
         self.bytes_per_sample = 2  # 16-bit
         self.channels = 1
+        # The divisor is constant for the whole test run; precompute it so
+        # the duration math is a single division at the end.
+        self._bytes_per_ms = (
+            self.sample_rate * self.bytes_per_sample * self.channels / 1000.0
+        )
         self.audio_received_after_flush_end = False
 
     def on_start(self, ten_env_tester: TenEnvTester) -> None:
         self.ten_env = ten_env_tester
         ten_env_tester.log_info("Flush test started, sending long TTS request.")
-        tts_input = TTSTextInput(
-            request_id="tts_request_for_flush",
-            text="This is a very long text designed to generate a continuous stream of audio, providing enough time to send a flush command.",
-        )
         data = Data.create("tts_text_input")
-        data.set_property_from_json(None, tts_input.model_dump_json())
+        data.set_property_from_json(None, _FLUSH_INPUT_JSON)
         ten_env_tester.send_data(data)
         ten_env_tester.on_start_done()
 
@@ -225,17 +235,16 @@ class ExtensionTesterFlush(ExtensionTester):
             self.first_audio_frame_received = True
             ten_env.log_info("First audio frame received, sending flush data.")
             flush_data = Data.create("tts_flush")
-            flush_data.set_property_from_json(
-                None,
-                TTSFlush(flush_id="tts_request_for_flush").model_dump_json(),
-            )
+            flush_data.set_property_from_json(None, _FLUSH_JSON)
             ten_env.send_data(flush_data)
 
-        buf = audio_frame.lock_buf()
-        try:
-            self.received_audio_bytes += len(buf)
-        finally:
-            audio_frame.unlock_buf(buf)
+        # Only the frame size is needed here; read it from the frame metadata
+        # instead of taking the buffer lock on every audio callback.
+        self.received_audio_bytes += (
+            audio_frame.get_samples_per_channel()
+            * audio_frame.get_bytes_per_sample()
+            * audio_frame.get_number_of_channels()
+        )
 
     def on_data(self, ten_env: TenEnvTester, data) -> None:
         name = data.get_name()
@@ -245,20 +254,17 @@ class ExtensionTesterFlush(ExtensionTester):
             self.audio_start_received = True
             return
 
-        json_str, _ = data.get_property_to_json(None)
-        if not json_str:
-            return
-        payload = json.loads(json_str)
-        ten_env.log_info(f"on_data payload: {payload}")
-
         if name == "tts_flush_start":
             self.flush_start_received = True
             return
 
         if name == "tts_audio_end":
             self.audio_end_received = True
-            self.audio_end_reason = payload.get("reason")
-            self.total_audio_duration_from_event = payload.get(
+            # Read just the two fields of interest with the runtime's typed
+            # getters instead of serializing the whole payload to JSON and
+            # parsing it back.
+            self.audio_end_reason, _ = data.get_property_string("reason")
+            self.total_audio_duration_from_event, _ = data.get_property_int(
                 "request_total_audio_duration_ms"
             )
 
@@ -269,14 +275,14 @@ class ExtensionTesterFlush(ExtensionTester):
                 ten_env.log_info("Waited after flush_end, stopping test now.")
                 ten_env.stop_test()
 
+            # One timer per test run; daemonize it so the interpreter never
+            # blocks joining the grace-period thread at shutdown.
             timer = threading.Timer(0.5, stop_test_later)
+            timer.daemon = True
             timer.start()
 
     def get_calculated_audio_duration_ms(self) -> int:
-        duration_sec = self.received_audio_bytes / (
-            self.sample_rate * self.bytes_per_sample * self.channels
-        )
-        return int(duration_sec * 1000)
+        return int(self.received_audio_bytes / self._bytes_per_ms)
 
 
 @patch("sarvam_http_tts.extension.SarvamTTSClient")
@@ -28,6 +28,9 @@ class SmallestTTSExtension(AsyncTTS2HttpExtension):
         # Type hints for better IDE support
         self.config: SmallestTTSConfig = None
         self.client: SmallestTTSClient = None
+        # Cached sample rate; the audio pipeline queries it per chunk and the
+        # config never changes after load.
+        self._sample_rate: int | None = None
 
     # ============================================================
     # Required method implementations
@@ -50,6 +53,9 @@ class SmallestTTSExtension(AsyncTTS2HttpExtension):
     def synthesize_audio_sample_rate(self) -> int:
         # Lightning emits PCM16 mono at the requested sample_rate
         # (8000-44100 Hz, 24000 recommended).
-        if self.config and self.config.params.get("sample_rate"):
-            return int(self.config.params["sample_rate"])
-        return DEFAULT_SAMPLE_RATE
+        if self._sample_rate is None:
+            if self.config and self.config.params.get("sample_rate"):
+                self._sample_rate = int(self.config.params["sample_rate"])
+            else:
+                self._sample_rate = DEFAULT_SAMPLE_RATE
+        return self._sample_rate
@@ -52,30 +52,34 @@ class SSEDecoder:
     """
 
     def __init__(self) -> None:
-        self._buffer = ""
+        self._buffer = bytearray()
 
     def feed(self, chunk: bytes) -> list[dict]:
         """Feed raw bytes; return the decoded `data:` payloads now complete."""
         if not chunk:
             return []
 
-        self._buffer += chunk.decode("utf-8", errors="replace")
-        lines = self._buffer.split("\n")
-        # Last element is either "" (chunk ended on a newline) or a partial
-        # line — keep it buffered either way.
-        self._buffer = lines.pop()
+        # Work on bytes end to end: extend() appends in place instead of
+        # re-concatenating strings, and only the JSON payload slice is ever
+        # decoded (json.loads accepts bytes directly).
+        self._buffer.extend(chunk)
 
         events: list[dict] = []
-        for line in lines:
-            line = line.strip()
-            if not line.startswith("data:"):
+        while True:
+            idx = self._buffer.find(b"\n")
+            if idx < 0:
+                # Partial line — keep it buffered until the rest arrives.
+                break
+            line = bytes(self._buffer[:idx]).strip()
+            del self._buffer[: idx + 1]
+            if not line.startswith(b"data:"):
                 continue
-            payload = line[len("data:") :].strip()
+            payload = line[len(b"data:") :].strip()
             if not payload:
                 continue
             try:
                 events.append(json.loads(payload))
-            except json.JSONDecodeError:
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 continue
         return events
 
@@ -107,6 +111,10 @@ class SmallestTTSClient(AsyncTTS2HttpClient):
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
             "X-Source": SOURCE_NAME,
+            # Keep the SSE audio stream uncompressed: a gzip/zstd response
+            # has to be inflated before events can be parsed, which defeats
+            # chunk-by-chunk streaming.
+            "Accept-Encoding": "identity",
         }
         # Merge: user headers override defaults
         self.headers = {**default_headers, **self.config.headers}
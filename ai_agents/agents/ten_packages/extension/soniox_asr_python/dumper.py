@@ -4,48 +4,132 @@
 # See the LICENSE file for more information.
 #
 
-import aiofiles
 import asyncio
 import os
 import secrets
 import time
 
 
+def _writev_all(fd: int, chunks: list[bytes]):
+    """Write every chunk to fd, resuming after partial writev() returns."""
+    total = sum(len(c) for c in chunks)
+    written = os.writev(fd, chunks)
+    while written < total:
+        # Skip whole chunks already on disk, trim the partial one, retry.
+        remaining: list[bytes] = []
+        skipped = 0
+        for chunk in chunks:
+            if skipped + len(chunk) <= written:
+                skipped += len(chunk)
+                continue
+            remaining.append(chunk[written - skipped :] if skipped < written else chunk)
+            skipped = written
+        chunks = remaining
+        total -= written
+        written = os.writev(fd, chunks)
+
+
 class Dumper:
     def __init__(self, dump_dir_path: str, dump_file_name: str):
         self.dump_dir_path = dump_dir_path
         self.dump_file_name = dump_file_name
         self._current_file_name = dump_file_name
-        self._file: aiofiles.threadpool.binary.AsyncBufferedIOBase | None = None
+        # Raw file descriptor: os.writev() flushes a whole batch of queued
+        # chunks in one syscall without joining them into a single buffer.
+        self._fd: int | None = None
         self._lock: asyncio.Lock = asyncio.Lock()
+        # push_bytes() only enqueues; a background task drains the queue and
+        # writes, so the audio path never waits on file I/O. A None item is
+        # the shutdown sentinel.
+        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        self._writer_task: asyncio.Task | None = None
+        # push_bytes() runs once per audio packet, so it calls whatever is
+        # bound here with no state checks: the queue's put_nowait while
+        # running, a no-op after stop(), and a raising stub before start().
+        self._write = self._write_not_started
+
+    def _write_not_started(self, data: bytes) -> None:
+        raise RuntimeError(
+            f"Dumper for {self._current_file_path()} is not opened. Please start the Dumper first."
+        )
+
+    @staticmethod
+    def _write_stopped(data: bytes) -> None:
+        pass
+
+    async def __aenter__(self) -> "Dumper":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
 
     async def start(self):
         async with self._lock:
-            if self._file:
+            if self._fd is not None:
                 return
 
             self._ensure_dir()
 
-            self._file = await aiofiles.open(
-                self._current_file_path(), mode="wb"
+            self._fd = os.open(
+                self._current_file_path(),
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                0o644,
             )
 
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._write_loop())
+
+        self._write = self._queue.put_nowait
+
     def _ensure_dir(self):
         os.makedirs(self.dump_dir_path, exist_ok=True)
 
     def _current_file_path(self) -> str:
         return os.path.join(self.dump_dir_path, self._current_file_name)
 
+    async def _write_loop(self):
+        while True:
+            data = await self._queue.get()
+            if data is None:
+                return
+
+            # Coalesce everything already queued into one writev call
+            # instead of paying a thread-pool round trip per chunk.
+            chunks = [data]
+            stop = False
+            while not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is None:
+                    stop = True
+                    break
+                chunks.append(item)
+
+            async with self._lock:
+                if self._fd is not None:
+                    await asyncio.to_thread(_writev_all, self._fd, chunks)
+
+            if stop:
+                return
+
     async def stop(self):
+        self._write = self._write_stopped
+
+        if self._writer_task:
+            # Let the writer drain what is queued, then exit on the sentinel.
+            await self._queue.put(None)
+            await self._writer_task
+            self._writer_task = None
+
         async with self._lock:
-            if self._file:
-                await self._file.close()
-                self._file = None
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
 
     async def rotate(self):
         """Close current file and open new one with timestamp suffix."""
         async with self._lock:
-            old_file = self._file
+            old_fd = self._fd
 
             try:
                 # Generate new filename
@@ -54,24 +138,23 @@ class Dumper:
 
                 # Open new file first
                 self._ensure_dir()
-                new_file = await aiofiles.open(
-                    self._current_file_path(), mode="wb"
+                new_fd = os.open(
+                    self._current_file_path(),
+                    os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                    0o644,
                 )
 
                 # Only close old file after new one opens successfully
-                if old_file:
-                    await old_file.close()
+                if old_fd is not None:
+                    os.close(old_fd)
 
-                self._file = new_file
+                self._fd = new_fd
             except Exception as e:
                 # Keep old file handle if rotation fails
-                self._file = old_file
+                self._fd = old_fd
                 raise RuntimeError(f"Failed to rotate dump file: {e}") from e
 
     async def push_bytes(self, data: bytes):
-        async with self._lock:
-            if not self._file:
-                raise RuntimeError(
-                    f"Dumper for {self._current_file_path()} is not opened. Please start the Dumper first."
-                )
-            _ = await self._file.write(data)
+        # Kept async for caller compatibility; the bound target never
+        # blocks, so there is nothing to await.
+        self._write(data)
@@ -1,5 +1,5 @@
 import asyncio
-from datetime import datetime
+import time
 
 
 from .config import TencentTTSConfig
@@ -56,14 +56,14 @@ class AsyncIteratorCallback(FlowingSpeechSynthesisListener):
 
         self._loop = asyncio.get_event_loop()
         self._queue = queue
-        self.sent_ts: datetime | None = None
+        self.sent_ts: int | None = None
         self.ttfb_sent: bool = False
         self.auth_error: bool = False  # Flag to track authentication errors
 
     def set_sent_ts(self):
         if self.sent_ts:
             return
-        self.sent_ts = datetime.now()
+        self.sent_ts = time.monotonic_ns()
 
     def on_close(self):
         super().on_close()
@@ -85,9 +85,7 @@ class AsyncIteratorCallback(FlowingSpeechSynthesisListener):
     def on_audio_result(self, audio_bytes):
         super().on_audio_result(audio_bytes)
         if self.sent_ts and not self.ttfb_sent:
-            ttfb_ms = int(
-                (datetime.now() - self.sent_ts).total_seconds() * 1000
-            )
+            ttfb_ms = (time.monotonic_ns() - self.sent_ts) // 1_000_000
             self.ttfb_sent = True
             asyncio.run_coroutine_threadsafe(
                 self._queue.put((False, MESSAGE_TYPE_CMD_METRIC, ttfb_ms)),
@@ -307,27 +305,27 @@ class TencentTTSClient:
         """
         return await self._receive_queue.get()
 
-    def _duration_in_ms(self, start: datetime, end: datetime) -> int:
+    def _duration_in_ms(self, start_ns: int, end_ns: int) -> int:
         """
-        Calculate duration between two timestamps in milliseconds.
+        Calculate duration between two monotonic timestamps in milliseconds.
 
         Args:
-            start: Start timestamp
-            end: End timestamp
+            start_ns: Start timestamp from time.monotonic_ns()
+            end_ns: End timestamp from time.monotonic_ns()
 
         Returns:
             Duration in milliseconds
         """
-        return int((end - start).total_seconds() * 1000)
+        return (end_ns - start_ns) // 1_000_000
 
-    def _duration_in_ms_since(self, start: datetime) -> int:
+    def _duration_in_ms_since(self, start_ns: int) -> int:
         """
-        Calculate duration from a timestamp to now in milliseconds.
+        Calculate duration from a monotonic timestamp to now in milliseconds.
 
         Args:
-            start: Start timestamp
+            start_ns: Start timestamp from time.monotonic_ns()
 
         Returns:
             Duration in milliseconds from start to now
         """
-        return self._duration_in_ms(start, datetime.now())
+        return self._duration_in_ms(start_ns, time.monotonic_ns())